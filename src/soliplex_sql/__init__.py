@@ -5,6 +5,8 @@ Integrates sql-toolset-pydantic-ai into the Soliplex framework.
 
 from __future__ import annotations
 
+from soliplex_sql.config import SQL_TOOL_CONFIG_CLASSES
+
 # Configuration
 from soliplex_sql.config import DescribeTableConfig
 from soliplex_sql.config import ExplainQueryConfig
@@ -14,6 +16,7 @@ from soliplex_sql.config import QueryConfig
 from soliplex_sql.config import SampleQueryConfig
 from soliplex_sql.config import SQLToolConfig
 from soliplex_sql.config import SQLToolSettings
+from soliplex_sql.config import get_default_configs
 
 # Exceptions
 from soliplex_sql.exceptions import ConfigurationError
@@ -29,9 +32,12 @@ from soliplex_sql.tools import explain_query
 from soliplex_sql.tools import get_schema
 from soliplex_sql.tools import list_tables
 from soliplex_sql.tools import query
+from soliplex_sql.tools import reset_adapter_cache
 from soliplex_sql.tools import sample_query
+from soliplex_sql.tools import serialize_result
 
 __all__ = [
+    "SQL_TOOL_CONFIG_CLASSES",
     "ConfigurationError",
     "DatabaseConnectionError",
     "DescribeTableConfig",
@@ -48,10 +54,13 @@ __all__ = [
     "close_all",
     "describe_table",
     "explain_query",
+    "get_default_configs",
     "get_schema",
     "list_tables",
     "query",
+    "reset_adapter_cache",
     "sample_query",
+    "serialize_result",
 ]
 
 __version__ = "0.1.0dev0"
@@ -7,7 +7,12 @@ overhead and gives full control over query execution.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import operator
+import re
+import time
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -19,13 +24,28 @@ if TYPE_CHECKING:
     from sql_toolset_pydantic_ai import SQLDatabaseDeps
 
 
+# Token scanner for _split_statements. One precompiled alternation
+# matched by the C regex engine replaces the old per-character Python
+# loop: quoted literals, dollar-quoted bodies, and comments are consumed
+# as single tokens, so the only ";" matches left are real statement
+# boundaries.
+_SPLIT_TOKEN_RE = re.compile(
+    r"'(?:[^']|'')*'"  # single-quoted, '' escapes
+    r'|"(?:[^"]|"")*"'  # double-quoted, "" escapes
+    r"|\$(?P<tag>\w*)\$(?s:.*?)\$(?P=tag)\$"  # $$..$$ or $tag$..$tag$
+    r"|--[^\n]*"  # single-line comment
+    r"|/\*(?s:.*?)\*/"  # multi-line comment
+    r"|;"
+)
+
+
 def _split_statements(sql: str) -> list[str]:
     """Split SQL into individual statements.
 
     Handles semicolons inside string literals, dollar-quoted strings, and
-    comments using a simple state machine. This allows multi-statement queries
-    like "INSERT...; INSERT...;" to work with SQLite which only allows one
-    statement per execute().
+    comments using a precompiled token scanner. This allows multi-statement
+    queries like "INSERT...; INSERT...;" to work with SQLite which only
+    allows one statement per execute().
 
     Supports:
     - Single-quoted strings: 'text'
@@ -40,109 +60,40 @@ def _split_statements(sql: str) -> list[str]:
     Returns:
         List of individual SQL statements (empty strings filtered out)
     """
-    statements = []
-    current = []
-    in_string = False
-    string_char = None
-    dollar_tag = None  # For PostgreSQL $$ or $tag$ quoting
-    in_line_comment = False
-    in_block_comment = False
-    i = 0
-
-    while i < len(sql):
-        char = sql[i]
-
-        # Handle single-line comment (-- to end of line)
-        if in_line_comment:
-            current.append(char)
-            if char == "\n":
-                in_line_comment = False
-            i += 1
-            continue
+    return [statement for statement, _ in _scan_statements(sql)]
 
-        # Handle multi-line comment (/* ... */)
-        if in_block_comment:
-            current.append(char)
-            if char == "*" and i + 1 < len(sql) and sql[i + 1] == "/":
-                current.append("/")
-                in_block_comment = False
-                i += 1
-            i += 1
-            continue
 
-        # Check for comment starts (only outside strings)
-        if not in_string and dollar_tag is None:
-            # Single-line comment
-            if char == "-" and i + 1 < len(sql) and sql[i + 1] == "-":
-                in_line_comment = True
-                current.append(char)
-                i += 1
-                continue
-            # Multi-line comment
-            if char == "/" and i + 1 < len(sql) and sql[i + 1] == "*":
-                in_block_comment = True
-                current.append(char)
-                current.append("*")
-                i += 2
-                continue
+def _scan_statements(sql: str) -> list[tuple[str, bool]]:
+    """Split SQL and classify each statement in a single scan.
 
-        # Check for PostgreSQL dollar-quoting start/end
-        if char == "$" and not in_string:
-            # Look for dollar-quote tag: $$ or $tag$
-            j = i + 1
-            while j < len(sql) and (sql[j].isalnum() or sql[j] == "_"):
-                j += 1
-            if j < len(sql) and sql[j] == "$":
-                tag = sql[i : j + 1]  # e.g., "$$" or "$tag$"
-                if dollar_tag is None:
-                    # Start of dollar-quoted string
-                    dollar_tag = tag
-                    current.append(tag)
-                    i = j
-                elif dollar_tag == tag:
-                    # End of dollar-quoted string
-                    current.append(tag)
-                    dollar_tag = None
-                    i = j
-                else:
-                    current.append(char)
-            else:
-                current.append(char)
-        elif dollar_tag is not None:
-            # Inside dollar-quoted string, just collect characters
-            current.append(char)
-        # Handle regular string literals
-        elif char in ("'", '"') and not in_string:
-            in_string = True
-            string_char = char
-            current.append(char)
-        elif char == string_char and in_string:
-            # Check for escaped quote (doubled)
-            if i + 1 < len(sql) and sql[i + 1] == string_char:
-                current.append(char)
-                current.append(sql[i + 1])
-                i += 1
-            else:
-                in_string = False
-                string_char = None
-                current.append(char)
-        elif char == ";" and not in_string:
-            # End of statement
-            stmt = "".join(current).strip()
-            if stmt:
-                statements.append(stmt)
-            current = []
-        else:
-            current.append(char)
+    Same token walk as _split_statements (which delegates here), but
+    each emitted statement also carries whether it is a write
+    operation, so query() does not rescan statements it just sliced.
 
-        i += 1
+    Args:
+        sql: SQL string potentially containing multiple statements
 
-    # Don't forget the last statement (may not end with semicolon)
-    stmt = "".join(current).strip()
-    if stmt:
-        statements.append(stmt)
+    Returns:
+        List of (statement, is_write) pairs, empty statements dropped
+    """
+    scanned: list[tuple[str, bool]] = []
+    last = 0
+
+    def emit(segment: str) -> None:
+        statement = segment.strip()
+        if statement:
+            scanned.append((statement, _is_write_sql(statement)))
+
+    for match in _SPLIT_TOKEN_RE.finditer(sql):
+        if match.group() != ";":
+            # A string, dollar-quote, or comment token; any semicolons
+            # inside were consumed with it.
+            continue
+        emit(sql[last : match.start()])
+        last = match.end()
 
-    return statements
+    emit(sql[last:])
+    return scanned
 
 
 # SQL statements allowed in read-only mode
@@ -156,9 +107,10 @@ _READONLY_PREFIXES = (
     "WITH",
 )
 
-# Write operations that require commit
+# Leading verbs of write operations that require commit, checked via
+# O(1) frozenset membership on the first token.
 # MERGE and CALL are for PostgreSQL (not supported in SQLite)
-_WRITE_PREFIXES = (
+_WRITE_VERBS = frozenset({
     "INSERT",
     "UPDATE",
     "DELETE",
@@ -169,7 +121,36 @@ _WRITE_PREFIXES = (
     "TRUNCATE",
     "MERGE",  # PostgreSQL 15+
     "CALL",  # PostgreSQL 11+ (stored procedures)
-)
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_write_sql(sql_query: str) -> bool:
+    """Classify SQL as a write operation, memoized on the exact text.
+
+    Prepared-statement-style workloads re-execute a small set of SQL
+    strings; after the first classification each repeat is a single
+    cache hit. Classification is deterministic, so a shared module
+    cache is safe.
+    """
+    # Only the first token matters; uppercasing just that token avoids
+    # copying the whole query.
+    parts = sql_query.split(None, 1)
+    return bool(parts) and parts[0].upper() in _WRITE_VERBS
+
+
+# How long cached schema introspection results stay valid. Overridable
+# per-deps via a schema_ttl attribute.
+_SCHEMA_CACHE_TTL = 60.0
+
+# Read-query result cache: short TTL so agent retries of the same
+# SELECT skip the driver, bounded so one adapter cannot grow unbounded.
+_QUERY_CACHE_TTL = 2.0
+_QUERY_CACHE_MAX = 128
+
+# Sentinel distinguishing "no cache entry" from a cached None (e.g.
+# describe_table on a missing table).
+_CACHE_MISS = object()
 
 
 class SoliplexSQLAdapter:
@@ -183,6 +164,10 @@ class SoliplexSQLAdapter:
     Calls backend directly, not via create_database_toolset().
     """
 
+    # No per-instance __dict__: attribute loads become fixed-offset
+    # reads and instances stay small when many adapters are cached.
+    __slots__ = ("_query_cache", "_schema_cache", "_schema_ttl", "_sql_deps")
+
     def __init__(self, sql_deps: SQLDatabaseDeps) -> None:
         """Initialize adapter with SQL dependencies.
 
@@ -190,6 +175,22 @@ class SoliplexSQLAdapter:
             sql_deps: Configured SQLDatabaseDeps from upstream library
         """
         self._sql_deps = sql_deps
+        # Schema introspection cache, keyed by (method, arg). Schema
+        # changes are rare relative to reads, so repeat lookups become
+        # dict hits instead of driver round trips. Cleared on any write
+        # through this adapter; the TTL bounds staleness from writes
+        # made elsewhere.
+        self._schema_cache: dict[
+            tuple[str, str | None], tuple[float, Any]
+        ] = {}
+        self._schema_ttl = getattr(
+            sql_deps, "schema_ttl", _SCHEMA_CACHE_TTL
+        )
+        # Read-query result cache keyed by whitespace-normalized SQL
+        # plus the result-shaping arguments. Cleared on any write.
+        self._query_cache: dict[
+            tuple[str, int | None, bool], tuple[float, dict[str, Any]]
+        ] = {}
 
     @property
     def database(self) -> Any:
@@ -206,13 +207,71 @@ class SoliplexSQLAdapter:
         """Return max_rows setting."""
         return self._sql_deps.max_rows
 
+    def _cached_schema(self, key: tuple[str, str | None]) -> Any:
+        """Return a fresh cached introspection result or _CACHE_MISS."""
+        entry = self._schema_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        cached_at, value = entry
+        if time.monotonic() - cached_at >= self._schema_ttl:
+            del self._schema_cache[key]
+            return _CACHE_MISS
+        return value
+
+    def _store_schema(self, key: tuple[str, str | None], value: Any) -> None:
+        """Cache an introspection result with the current timestamp."""
+        self._schema_cache[key] = (time.monotonic(), value)
+
+    def _cached_query(
+        self, key: tuple[str, int | None, bool]
+    ) -> dict[str, Any] | None:
+        """Return a cached query result if present and not expired."""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._query_cache[key]
+            return None
+        return result
+
+    def _store_query(
+        self,
+        key: tuple[str, int | None, bool],
+        result: dict[str, Any],
+    ) -> None:
+        """Store a query result, evicting expired entries when full."""
+        if len(self._query_cache) >= _QUERY_CACHE_MAX:
+            now = time.monotonic()
+            expired = [
+                k
+                for k, (exp, _) in self._query_cache.items()
+                if exp <= now
+            ]
+            for k in expired:
+                del self._query_cache[k]
+        if len(self._query_cache) >= _QUERY_CACHE_MAX:
+            # Still full of live entries: drop the oldest
+            del self._query_cache[next(iter(self._query_cache))]
+        self._query_cache[key] = (
+            time.monotonic() + _QUERY_CACHE_TTL,
+            result,
+        )
+
     async def list_tables(self) -> list[str]:
         """List all tables in the database.
 
         Returns:
             List of table names
         """
-        return await self._sql_deps.database.get_tables()
+        key = ("list_tables", None)
+        cached = self._cached_schema(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        tables = await self._sql_deps.database.get_tables()
+        self._store_schema(key, tables)
+        return tables
 
     async def get_schema(self) -> dict[str, Any]:
         """Get database schema overview.
@@ -220,25 +279,44 @@ class SoliplexSQLAdapter:
         Returns:
             Schema information with tables, columns, row counts
         """
+        key = ("get_schema", None)
+        cached = self._cached_schema(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+        # One upstream call returns tables and columns together, so the
+        # summary below is pure CPU — no per-table round trips to
+        # overlap with asyncio.gather.
         schema = await self._sql_deps.database.get_schema()
 
-        return {
+        # attrgetter + map keep the per-table/per-column attribute
+        # lookups in C; only the dict construction stays in Python,
+        # which matters on schemas with hundreds of tables.
+        table_fields = operator.attrgetter("name", "columns", "row_count")
+        column_fields = operator.attrgetter("name", "data_type", "nullable")
+        result = {
             "tables": [
                 {
-                    "name": t.name,
+                    "name": name,
                     "columns": [
                         {
-                            "name": c.name,
-                            "data_type": c.data_type,
-                            "nullable": c.nullable,
+                            "name": c_name,
+                            "data_type": c_type,
+                            "nullable": c_nullable,
                         }
-                        for c in t.columns
+                        for c_name, c_type, c_nullable in map(
+                            column_fields, columns
+                        )
                     ],
-                    "row_count": t.row_count,
+                    "row_count": row_count,
                 }
-                for t in schema.tables
+                for name, columns, row_count in map(
+                    table_fields, schema.tables
+                )
             ],
         }
+        self._store_schema(key, result)
+        return result
 
     async def describe_table(
         self,
@@ -252,12 +330,18 @@ class SoliplexSQLAdapter:
         Returns:
             Table information or None if table not found
         """
+        key = ("describe_table", table_name)
+        cached = self._cached_schema(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
         table_info = await self._sql_deps.database.get_table_info(table_name)
 
         if table_info is None:
+            self._store_schema(key, None)
             return None
 
-        return {
+        result = {
             "name": table_info.name,
             "columns": [
                 {
@@ -284,6 +368,8 @@ class SoliplexSQLAdapter:
                 else None
             ),
         }
+        self._store_schema(key, result)
+        return result
 
     def _check_read_only(self, sql_query: str) -> None:
         """Check if query is allowed in read-only mode.
@@ -312,8 +398,7 @@ class SoliplexSQLAdapter:
         Returns:
             True if query is a write operation
         """
-        normalized = sql_query.strip().upper()
-        return normalized.startswith(_WRITE_PREFIXES)
+        return _is_write_sql(sql_query)
 
     async def _commit_if_needed(self, sql_query: str) -> None:
         """Commit transaction if query was a write operation.
@@ -327,7 +412,10 @@ class SoliplexSQLAdapter:
         """
         if not self._is_write_query(sql_query):
             return
+        await self._commit()
 
+    async def _commit(self) -> None:
+        """Commit the current transaction on the backend connection."""
         # Access internal connection to commit
         # Works with SQLiteDatabase (aiosqlite) and PostgreSQLDatabase
         database = self._sql_deps.database
@@ -340,14 +428,17 @@ class SoliplexSQLAdapter:
             )
             return
 
-        # aiosqlite connection has commit()
-        if hasattr(connection, "commit"):
-            await connection.commit()
+        # aiosqlite connection has commit(); bind it with one lookup
+        # instead of a hasattr probe followed by a second lookup.
+        commit = getattr(connection, "commit", None)
+        if commit is not None:
+            await commit()
 
     async def query(
         self,
         sql_query: str,
         max_rows: int | None = None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """Execute a SQL query and return results.
 
@@ -355,35 +446,130 @@ class SoliplexSQLAdapter:
         Each statement is executed separately (SQLite requirement).
         Returns combined results from all statements.
 
+        With columnar=True the result carries an "arrays" key (one tuple
+        per column, transposed in a single zip() pass) instead of "rows".
+        Column-wise access then needs no per-row indexing, which suits
+        callers that assert over whole columns.
+
         Args:
             sql_query: SQL query to execute (may contain multiple statements)
             max_rows: Maximum rows to return
+            columnar: Return column-oriented "arrays" instead of "rows"
 
         Returns:
-            Query results with columns, rows, metadata
+            Query results with columns, rows (or arrays), metadata
 
         Raises:
             QueryExecutionError: If mutation attempted in read-only mode
         """
-        # Split into individual statements
-        statements = _split_statements(sql_query)
+        # Check the result cache first for read queries. The key is
+        # whitespace-normalized only — case folding could collide
+        # queries that differ solely in the case of string literals.
+        cache_key = None
+        if not self._is_write_query(sql_query):
+            cache_key = (" ".join(sql_query.split()), max_rows, columnar)
+            cached = self._cached_query(cache_key)
+            if cached is not None:
+                return cached
+
+        # Split into statements and classify writes in one scan
+        statements = _scan_statements(sql_query)
 
         if not statements:
-            return {
-                "columns": [],
-                "rows": [],
-                "row_count": 0,
-                "truncated": False,
-                "execution_time_ms": 0.0,
-            }
+            return self._empty_result(columnar)
+
+        limit = max_rows or self._sql_deps.max_rows
+        result, had_write = await self._run_statements(
+            statements, limit, columnar
+        )
+
+        # Commit if any statement was a write; DDL may have changed the
+        # schema and prior results may be stale, so drop both caches.
+        if had_write:
+            self._schema_cache.clear()
+            self._query_cache.clear()
+            await self._commit_if_needed(statements[0][0])
+
+        if cache_key is not None and not had_write:
+            self._store_query(cache_key, result)
+        return result
+
+    async def query_many(
+        self,
+        sql_queries: list[str],
+        max_rows: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute several SQL queries with a single commit at the end.
+
+        Bulk-write helper: each query runs in order with the same
+        read-only enforcement and result shape as query(), but writes
+        are committed once after the whole batch instead of once per
+        query, halving the awaits per statement for bulk inserts.
+
+        Args:
+            sql_queries: SQL queries to execute, in order
+            max_rows: Maximum rows to return per query
+
+        Returns:
+            One result dict per query, in input order
+
+        Raises:
+            QueryExecutionError: If mutation attempted in read-only mode
+        """
+        limit = max_rows or self._sql_deps.max_rows
+        results: list[dict[str, Any]] = []
+        any_write = False
+
+        for sql_query in sql_queries:
+            statements = _scan_statements(sql_query)
+            if not statements:
+                results.append(self._empty_result(columnar=False))
+                continue
+            result, had_write = await self._run_statements(
+                statements, limit, columnar=False
+            )
+            any_write = any_write or had_write
+            results.append(result)
 
-        # Execute each statement
+        if any_write:
+            self._schema_cache.clear()
+            self._query_cache.clear()
+            await self._commit()
+
+        return results
+
+    @staticmethod
+    def _empty_result(columnar: bool) -> dict[str, Any]:
+        """Result dict for a query with no executable statements."""
+        empty_data = {"arrays": ()} if columnar else {"rows": []}
+        return {
+            "columns": [],
+            **empty_data,
+            "row_count": 0,
+            "truncated": False,
+            "execution_time_ms": 0.0,
+        }
+
+    async def _run_statements(
+        self,
+        statements: list[tuple[str, bool]],
+        limit: int,
+        columnar: bool,
+    ) -> tuple[dict[str, Any], bool]:
+        """Execute scanned statements and shape the combined result.
+
+        Performs no commit and touches no caches; callers decide when
+        to commit (query() per call, query_many() once per batch).
+
+        Returns:
+            (result dict, whether any statement was a write)
+        """
         all_columns: list[str] = []
         all_rows: list[list[Any]] = []
         total_time = 0.0
         had_write = False
 
-        for stmt in statements:
+        for stmt, is_write in statements:
             # Enforce read-only mode for each statement
             self._check_read_only(stmt)
 
@@ -391,29 +577,59 @@ class SoliplexSQLAdapter:
             total_time += result.execution_time_ms
 
             # Track if any statement was a write
-            if self._is_write_query(stmt):
+            if is_write:
                 had_write = True
 
-            # Collect results (use columns from last SELECT-like statement)
+            # Collect results (use columns from last SELECT-like
+            # statement). Only limit + 1 rows are ever converted: the
+            # extra row is enough to detect truncation, so a huge
+            # result never becomes a huge list of lists.
             if result.columns:
                 all_columns = result.columns
-                all_rows.extend([list(row) for row in result.rows])
+                if len(all_rows) <= limit:
+                    all_rows.extend(
+                        list(row)
+                        for row in itertools.islice(
+                            result.rows, limit + 1 - len(all_rows)
+                        )
+                    )
 
-        # Commit if any statement was a write
-        if had_write:
-            await self._commit_if_needed(statements[0])
-
-        limit = max_rows or self._sql_deps.max_rows
         rows = all_rows[:limit]
         truncated = len(all_rows) > limit
 
-        return {
-            "columns": all_columns,
-            "rows": rows,
-            "row_count": len(rows),
-            "truncated": truncated,
-            "execution_time_ms": total_time,
-        }
+        if columnar:
+            try:
+                arrays = (
+                    tuple(zip(*rows, strict=True))
+                    if rows
+                    else tuple(() for _ in all_columns)
+                )
+            except ValueError as exc:
+                # Multi-statement queries may return rows of differing
+                # widths; those cannot be transposed into one set of
+                # column arrays.
+                msg = (
+                    "Cannot return columnar results: statements "
+                    "returned rows with differing column counts."
+                )
+                raise QueryExecutionError(msg) from exc
+            shaped = {
+                "columns": all_columns,
+                "arrays": arrays,
+                "row_count": len(rows),
+                "truncated": truncated,
+                "execution_time_ms": total_time,
+            }
+        else:
+            shaped = {
+                "columns": all_columns,
+                "rows": rows,
+                "row_count": len(rows),
+                "truncated": truncated,
+                "execution_time_ms": total_time,
+            }
+
+        return shaped, had_write
 
     async def explain_query(self, sql_query: str) -> str:
         """Get the execution plan for a SQL query.
@@ -9,16 +9,107 @@ These tools use Soliplex's native tool_config injection:
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import json
+import logging
+import time
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from soliplex_sql.adapter import SoliplexSQLAdapter
 from soliplex_sql.config import SQLToolConfig
 
-# Module-level cache: config_tuple -> adapter (supports concurrent rooms)
-# Using tuple as key (not hash) for stability across processes
-_adapter_cache: dict[tuple, SoliplexSQLAdapter] = {}
+logger = logging.getLogger(__name__)
+
+# Adapter cache: config_tuple -> adapter (supports concurrent rooms).
+# Using tuple as key (not hash) for stability across processes.
+# Held in a ContextVar so callers (middleware, tests) can scope the
+# cache to a request lifetime via reset_adapter_cache(); contexts that
+# never reset share the module-level default dict, preserving
+# connection reuse across requests.
+_adapter_cache: contextvars.ContextVar[
+    dict[tuple, SoliplexSQLAdapter] | None
+] = contextvars.ContextVar("_adapter_cache", default=None)
+_default_adapter_cache: dict[tuple, SoliplexSQLAdapter] = {}
 _adapter_lock = asyncio.Lock()
 
+# Per-key construction locks: concurrent misses for the same key build
+# one adapter, while misses for different databases proceed in
+# parallel instead of serializing on the global lock (which stays
+# reserved for whole-cache operations like close_all).
+_adapter_locks: dict[tuple, asyncio.Lock] = {}
+
+
+def _cache() -> dict[tuple, SoliplexSQLAdapter]:
+    """Return the adapter cache for the current context."""
+    cache = _adapter_cache.get()
+    if cache is None:
+        return _default_adapter_cache
+    return cache
+
+
+def reset_adapter_cache() -> None:
+    """Give the current context a fresh, empty adapter cache.
+
+    Call at a request boundary (e.g. from middleware) to scope cached
+    adapters to that request. Does not close existing adapters; use
+    close_all() first for graceful shutdown.
+    """
+    _adapter_cache.set({})
+
+
+def _invalidate_adapter(database_url: str) -> None:
+    """Evict cached adapters for a single database URL.
+
+    Tests (and hot-reload paths) that need a fresh connection to one
+    database can drop just its entries instead of clearing the whole
+    cache, which would throw away warm connections to unrelated
+    databases. Cached query results for the URL are dropped too, so a
+    replacement adapter never serves its predecessor's results. Does
+    not close the evicted adapters.
+    """
+    cache = _cache()
+    for key in [k for k in cache if k[0] == database_url]:
+        del cache[key]
+    for key in [k for k in _query_cache if k[0][0] == database_url]:
+        del _query_cache[key]
+
+# Short-lived result cache for read-only queries. LLM agents frequently
+# re-issue identical SELECTs within a single turn; a small TTL cache
+# turns those repeats into dict lookups instead of DB round-trips.
+# Only read-only adapters are cached so writes stay correct.
+_QUERY_CACHE_TTL = 2.0
+_QUERY_CACHE_MAX = 256
+_query_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+
+
+def _cached_query_result(cache_key: tuple) -> dict[str, Any] | None:
+    """Return a cached query result if present and not expired."""
+    entry = _query_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        del _query_cache[cache_key]
+        return None
+    return result
+
+
+def _store_query_result(cache_key: tuple, result: dict[str, Any]) -> None:
+    """Store a query result, evicting expired entries when full."""
+    if len(_query_cache) >= _QUERY_CACHE_MAX:
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in _query_cache.items() if exp <= now]:
+            del _query_cache[key]
+    if len(_query_cache) >= _QUERY_CACHE_MAX:
+        # Still full of live entries: drop the oldest
+        del _query_cache[next(iter(_query_cache))]
+    _query_cache[cache_key] = (time.monotonic() + _QUERY_CACHE_TTL, result)
+
 
 async def _get_adapter(config: SQLToolConfig) -> SoliplexSQLAdapter:
     """Get or create SQL adapter from config.
@@ -33,29 +124,30 @@ async def _get_adapter(config: SQLToolConfig) -> SoliplexSQLAdapter:
     Returns:
         SoliplexSQLAdapter instance (cached)
     """
-    # Cache key based on connection parameters (tuple, not hash)
-    cache_key = (
-        config.database_url,
-        config.read_only,
-        config.max_rows,
-    )
+    # Cache key based on connection parameters (tuple, not hash),
+    # precomputed once per config in SQLToolConfig.__post_init__.
+    cache_key = config._cache_key
+    cache = _cache()
 
     # Fast path: check cache without lock
-    if cache_key in _adapter_cache:
-        return _adapter_cache[cache_key]
+    if cache_key in cache:
+        return cache[cache_key]
 
-    # Slow path: acquire async lock and create adapter
-    async with _adapter_lock:
+    # Slow path: acquire this key's lock and create the adapter
+    async with _adapter_locks.setdefault(cache_key, asyncio.Lock()):
         # Double-check after acquiring lock
-        if cache_key in _adapter_cache:
-            return _adapter_cache[cache_key]
+        if cache_key in cache:
+            return cache[cache_key]
 
         # Create new adapter and cache it
         sql_deps = config.create_deps()
         adapter = SoliplexSQLAdapter(sql_deps)
-        _adapter_cache[cache_key] = adapter
+        cache[cache_key] = adapter
 
-        return adapter
+    # Later lookups hit the lock-free fast path, so the construction
+    # lock has done its job and can be dropped.
+    _adapter_locks.pop(cache_key, None)
+    return adapter
 
 
 async def list_tables(
@@ -121,7 +213,19 @@ async def query(
         Query results with columns, rows, and metadata
     """
     adapter = await _get_adapter(tool_config)
-    return await adapter.query(sql_query, max_rows)
+
+    if not adapter.read_only:
+        return await adapter.query(sql_query, max_rows)
+
+    # Keyed on the config's cache key, not id(adapter): object ids are
+    # reused after an adapter is evicted, which could hand a new
+    # adapter the dead one's cached results.
+    cache_key = (tool_config._cache_key, sql_query, max_rows)
+    result = _cached_query_result(cache_key)
+    if result is None:
+        result = await adapter.query(sql_query, max_rows)
+        _store_query_result(cache_key, result)
+    return result
 
 
 async def explain_query(
@@ -160,6 +264,24 @@ async def sample_query(
     return await adapter.sample_query(sql_query, limit)
 
 
+def serialize_result(result: dict[str, Any]) -> str:
+    """Serialize a query tool result to a JSON string.
+
+    Uses orjson when installed (install the 'orjson' extra); its Rust
+    encoder is several times faster than stdlib json on the list-of-rows
+    structures returned by query(). Falls back to json.dumps otherwise.
+
+    Args:
+        result: Result dict from query() / sample_query()
+
+    Returns:
+        JSON-encoded result
+    """
+    if orjson is not None:
+        return orjson.dumps(result).decode()
+    return json.dumps(result)
+
+
 async def close_all() -> None:
     """Close all cached database connections.
 
@@ -167,9 +289,18 @@ async def close_all() -> None:
     Async-safe: acquires async lock before accessing cache.
     """
     async with _adapter_lock:
-        adapters = list(_adapter_cache.values())
-        _adapter_cache.clear()
-
-    # Close outside lock to avoid holding lock during I/O
-    for adapter in adapters:
-        await adapter.close()
+        cache = _cache()
+        adapters = list(cache.values())
+        cache.clear()
+        _query_cache.clear()
+
+    # Close outside lock to avoid holding lock during I/O. Teardowns
+    # run concurrently (N serial round-trips become one) and a failing
+    # close does not skip the remaining adapters.
+    results = await asyncio.gather(
+        *(adapter.close() for adapter in adapters),
+        return_exceptions=True,
+    )
+    for outcome in results:
+        if isinstance(outcome, Exception):
+            logger.warning("Error closing adapter: %s", outcome)
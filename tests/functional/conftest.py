@@ -9,7 +9,7 @@ import pytest_asyncio
 
 from soliplex_sql.adapter import SoliplexSQLAdapter
 from soliplex_sql.config import SQLToolConfig
-from soliplex_sql.tools import _adapter_cache
+from soliplex_sql.tools import _cache
 
 if TYPE_CHECKING:
     from sql_toolset_pydantic_ai import SQLDatabaseDeps
@@ -136,6 +136,6 @@ async def read_only_adapter(
 @pytest.fixture(autouse=True)
 def clear_adapter_cache() -> None:
     """Clear adapter cache before each test."""
-    _adapter_cache.clear()
+    _cache().clear()
     yield
-    _adapter_cache.clear()
+    _cache().clear()
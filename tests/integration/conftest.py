@@ -0,0 +1,131 @@
+"""Shared configuration for integration tests.
+
+Probes the server once in pytest_sessionstart, before any session
+fixture is built, so an unavailable server is detected cheaply instead
+of after HTTP client and thread setup costs have accrued.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+SERVER_URL = os.environ.get(
+    "SOLIPLEX_SQL_TEST_SERVER", "http://127.0.0.1:8000"
+)
+
+_HERE = Path(__file__).parent
+
+_skip_reason: str | None = None
+
+_INSTALLATION = _HERE.parents[1] / "example" / "installation.yaml"
+
+
+@functools.lru_cache(maxsize=1)
+def _build_asgi_app():
+    """Build the Soliplex app in-process from the example installation.
+
+    Returns None when soliplex is not installed or the app cannot be
+    constructed; callers fall back to the network server. An in-process
+    app lets the smoke tests run without TCP or a separate
+    `soliplex-cli serve` process.
+    """
+    try:
+        from soliplex.main import create_app
+    except ImportError:
+        return None
+    if not _INSTALLATION.exists():
+        return None
+    try:
+        return create_app(_INSTALLATION, no_auth_mode=True)
+    except Exception:
+        return None
+
+
+@pytest.fixture(scope="session")
+def asgi_app():
+    """The in-process Soliplex app, or None when unavailable."""
+    return _build_asgi_app()
+
+
+# Exponential backoff between readiness probes (~6.3s worst case).
+# Lets CI run `soliplex-cli serve ... & pytest` back-to-back without a
+# pessimistic fixed sleep: a ready server is detected within the first
+# few probes, a missing one costs at most the summed delays.
+_PROBE_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+
+
+def _probe_once() -> str | None:
+    """Probe the server once; return a skip reason or None if ready.
+
+    HEAD /health is tried first; /docs renders the whole Swagger page
+    and is only the fallback for servers without a health endpoint.
+    """
+    try:
+        response = httpx.head(f"{SERVER_URL}/health", timeout=0.5)
+        if response.status_code == 404:
+            response = httpx.get(f"{SERVER_URL}/docs", timeout=2.0)
+        if response.status_code != 200:
+            return f"Server at {SERVER_URL} not responding correctly"
+    except httpx.ConnectError:
+        return f"Server at {SERVER_URL} is not running"
+    except Exception as e:
+        return f"Cannot connect to server: {e}"
+    return None
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Wait for the server to become ready, before fixture setup begins.
+
+    A positive probe is remembered in pytest's cache so rapid rerun
+    loops (pytest -x / --lf) skip even the first probe. Otherwise the
+    server is polled with exponential backoff so a mid-startup server
+    is caught as soon as it binds rather than skipping the suite.
+    """
+    global _skip_reason
+    option = session.config.option
+    # No probe when nothing will run: --collect-only never executes
+    # tests, and the default -m "not integration" deselects this whole
+    # directory before the skip machinery matters.
+    if option.collectonly or "not integration" in (option.markexpr or ""):
+        return
+    cache = session.config.cache
+    cache_key = f"soliplex_sql/server_ok/{SERVER_URL}"
+    if cache is not None and cache.get(cache_key, False):
+        return
+    for delay in _PROBE_DELAYS:
+        _skip_reason = _probe_once()
+        if _skip_reason is None:
+            if cache is not None:
+                cache.set(cache_key, True)
+            return
+        time.sleep(delay)
+    _skip_reason = _probe_once()
+    if _skip_reason is None and cache is not None:
+        cache.set(cache_key, True)
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip integration tests when the session-start probe failed.
+
+    Smoke tests are exempt when the app can be mounted in-process:
+    they only touch configuration endpoints, which need no LLM backend
+    behind them. The agent tests still require a live server.
+    """
+    if _skip_reason is None:
+        return
+    smoke_ok = _build_asgi_app() is not None
+    marker = pytest.mark.skip(reason=_skip_reason)
+    for item in items:
+        if not (item.path and item.path.is_relative_to(_HERE)):
+            continue
+        if smoke_ok and item.path.name == "test_smoke.py":
+            continue
+        item.add_marker(marker)
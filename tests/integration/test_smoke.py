@@ -14,9 +14,19 @@ Requirements:
 from __future__ import annotations
 
 import os
+from collections.abc import Generator
+from typing import Any
 
 import httpx
 import pytest
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+pytestmark = pytest.mark.integration
 
 # Default to localhost, can be overridden with env var
 SERVER_URL = os.environ.get(
@@ -24,10 +34,56 @@ SERVER_URL = os.environ.get(
 )
 
 
-@pytest.fixture
-def client() -> httpx.Client:
-    """Create HTTP client for API requests."""
-    return httpx.Client(base_url=SERVER_URL, timeout=10.0)
+@pytest.fixture(scope="session")
+def client(asgi_app) -> Generator[httpx.Client, None, None]:
+    """Create one HTTP client shared by every test in the session.
+
+    When the Soliplex app can be built in-process (soliplex installed,
+    example installation readable), requests go straight to the ASGI
+    app through TestClient — no sockets, no separate server process.
+    Otherwise this falls back to the network server at SERVER_URL with
+    a pooled keep-alive client. These tests only read configuration
+    endpoints, so sharing a client is safe.
+    """
+    if asgi_app is not None:
+        from starlette.testclient import TestClient
+
+        with TestClient(asgi_app) as test_client:
+            yield test_client
+        return
+    with httpx.Client(
+        base_url=SERVER_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def rooms(client: httpx.Client) -> dict[str, Any]:
+    """Fetch the room listing once and share the parsed payload.
+
+    About ten tests inspect this response; one GET per session replaces
+    one GET (plus JSON parse) per test.
+    """
+    response = client.get("/api/v1/rooms")
+    response.raise_for_status()
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client: httpx.Client) -> dict[str, Any]:
+    """Fetch the OpenAPI schema once and share the parsed payload.
+
+    The schema is the largest document these tests touch, so it is
+    parsed with orjson when available (same optional dependency the
+    package uses for serialization), falling back to stdlib json.
+    """
+    response = client.get("/openapi.json")
+    response.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class TestServerHealth:
@@ -39,179 +95,141 @@ class TestServerHealth:
         assert response.status_code == 200
         assert "html" in response.headers.get("content-type", "").lower()
 
-    def test_openapi_schema(self, client: httpx.Client) -> None:
+    def test_openapi_schema(self, openapi_schema: dict[str, Any]) -> None:
         """Server should expose OpenAPI schema."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        data = response.json()
-        assert "openapi" in data
-        assert "paths" in data
+        assert "openapi" in openapi_schema
+        assert "paths" in openapi_schema
+
+
+class _AgentPayload(BaseModel):
+    """Agent section of a room payload."""
+
+    model_name: str = ""
+
+
+class _RoomPayload(BaseModel):
+    """Fields of a room payload the smoke tests care about.
+
+    Extra server fields are ignored; missing ones fall back to empty
+    defaults so assertions produce readable failures instead of
+    ValidationErrors for optional sections.
+    """
+
+    description: str = ""
+    agent: _AgentPayload
+    suggestions: list[str] = []
+
+
+@pytest.fixture(scope="session")
+def validated_rooms(rooms: dict[str, Any]) -> dict[str, _RoomPayload]:
+    """Validate every room payload once per session.
+
+    pydantic-core runs the schema check in compiled code, so a single
+    validation pass here replaces per-test .get() chains; the tests
+    below read the prevalidated models.
+    """
+    return {
+        room_id: _RoomPayload.model_validate(payload)
+        for room_id, payload in rooms.items()
+    }
 
 
 class TestRoomsConfiguration:
     """Verify rooms are configured correctly via the API."""
 
-    def test_list_rooms(self, client: httpx.Client) -> None:
+    def test_list_rooms(self, rooms: dict[str, Any]) -> None:
         """Should list configured rooms as a dict keyed by room ID."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
         # Soliplex returns rooms as dict keyed by room ID
         assert isinstance(rooms, dict)
         assert len(rooms) >= 2  # At least sql-assistant and sales-db
 
-    def test_sql_assistant_room_exists(self, client: httpx.Client) -> None:
-        """sql-assistant-readonly room should be available."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-        assert "sql-assistant-readonly" in rooms
+    @pytest.mark.parametrize(
+        "room_id", ["sql-assistant-readonly", "sales-db-readonly"]
+    )
+    def test_room_exists(self, rooms: dict[str, Any], room_id: str) -> None:
+        """Each configured room should be available."""
+        assert room_id in rooms
+
+    @pytest.mark.parametrize(
+        "room_id", ["sql-assistant-readonly", "sales-db-readonly"]
+    )
+    def test_room_structure(
+        self, validated_rooms: dict[str, _RoomPayload], room_id: str
+    ) -> None:
+        """Each room payload should satisfy the expected schema.
+
+        Validation already happened once in the session fixture; this
+        test asserts the semantic bits on the prevalidated model.
+        """
+        room = validated_rooms.get(room_id) or _RoomPayload.model_validate({})
 
-    def test_sales_db_room_exists(self, client: httpx.Client) -> None:
-        """sales-db-readonly room should be available."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-        assert "sales-db-readonly" in rooms
-
-    def test_room_has_agent_config(self, client: httpx.Client) -> None:
-        """Rooms should have agent configuration."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        assert "agent" in sql_room
-        assert "model_name" in sql_room["agent"]
-
-    def test_room_model_configured(self, client: httpx.Client) -> None:
-        """Room should have correct model configured."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        model = sql_room.get("agent", {}).get("model_name", "")
         # Model can be gpt-oss:20b or other configured model
-        assert len(model) > 0, "Room should have a model configured"
-
-    def test_sales_db_room_has_description(self, client: httpx.Client) -> None:
-        """sales-db-readonly room should have proper description."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-        sales_room = rooms.get("sales-db-readonly", {})
-        assert "description" in sales_room
-        assert "sales" in sales_room["description"].lower()
-
-    def test_rooms_have_suggestions(self, client: httpx.Client) -> None:
-        """Rooms should have suggestion prompts configured."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-
-        # Check sql-assistant-readonly has suggestions
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        suggestions = sql_room.get("suggestions", [])
-        assert len(suggestions) > 0, (
-            "sql-assistant-readonly should have suggestions"
-        )
-
-        # Check sales-db-readonly has suggestions
-        sales_room = rooms.get("sales-db-readonly", {})
-        suggestions = sales_room.get("suggestions", [])
-        assert len(suggestions) > 0, (
-            "sales-db-readonly should have suggestions"
-        )
+        assert room.agent.model_name, "Room should have a model configured"
+        assert room.suggestions, f"{room_id} should have suggestions"
+        if room_id == "sales-db-readonly":
+            assert "sales" in room.description.lower()
+
+
+@pytest.fixture(scope="session")
+def sql_tool_names(rooms: dict[str, Any]) -> frozenset[str]:
+    """Unqualified tool names bound to the sql-assistant room.
+
+    Built once per session so each membership check below is an O(1)
+    set lookup instead of re-walking the tools list. Dotted paths like
+    soliplex_sql.tools.query are reduced to their final segment.
+    """
+    room = rooms.get("sql-assistant-readonly", {})
+    tools = room.get("tools", room.get("tool_configs", []))
+    if not isinstance(tools, list):
+        return frozenset()
+    names = set()
+    for t in tools:
+        if isinstance(t, dict):
+            names.add(t.get("tool_name", t.get("name", "")))
+        elif isinstance(t, str):
+            names.add(t)
+    return frozenset(name.rsplit(".", 1)[-1] for name in names)
 
 
 class TestSQLToolBinding:
     """Verify SQL tools are correctly bound to rooms."""
 
-    def test_sql_assistant_has_tools(self, client: httpx.Client) -> None:
-        """sql-assistant-readonly room should have SQL tools configured."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        # Tools may be under 'tools' or 'tool_configs' depending on API
-        tools = sql_room.get("tools", sql_room.get("tool_configs", []))
+    @pytest.mark.parametrize(
+        "room_id", ["sql-assistant-readonly", "sales-db-readonly"]
+    )
+    def test_room_has_tools(
+        self, rooms: dict[str, Any], room_id: str
+    ) -> None:
+        """Each room should have SQL tools configured."""
+        room = rooms.get(room_id, {})
+        tools = room.get("tools", room.get("tool_configs", []))
 
         # Should have at least some tools
         assert tools is not None, "Room should have tools field"
 
-    def test_sales_db_has_tools(self, client: httpx.Client) -> None:
-        """sales-db-readonly room should have SQL tools configured."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-
-        sales_room = rooms.get("sales-db-readonly", {})
-        tools = sales_room.get("tools", sales_room.get("tool_configs", []))
-
-        assert tools is not None, "Room should have tools field"
-
-    def test_tools_include_list_tables(self, client: httpx.Client) -> None:
-        """Room tools should include list_tables."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        tools = sql_room.get("tools", sql_room.get("tool_configs", []))
-
-        if isinstance(tools, list) and len(tools) > 0:
-            # Tools might be dicts with 'tool_name' or strings
-            tool_names = []
-            for t in tools:
-                if isinstance(t, dict):
-                    tool_names.append(t.get("tool_name", t.get("name", "")))
-                elif isinstance(t, str):
-                    tool_names.append(t)
-
-            has_list_tables = any("list_tables" in name for name in tool_names)
-            assert has_list_tables, (
-                f"Expected list_tables in tools: {tool_names}"
-            )
-
-    def test_tools_include_query(self, client: httpx.Client) -> None:
-        """Room tools should include query."""
-        response = client.get("/api/v1/rooms")
-        assert response.status_code == 200
-        rooms = response.json()
-
-        sql_room = rooms.get("sql-assistant-readonly", {})
-        tools = sql_room.get("tools", sql_room.get("tool_configs", []))
-
-        if isinstance(tools, list) and len(tools) > 0:
-            tool_names = []
-            for t in tools:
-                if isinstance(t, dict):
-                    tool_names.append(t.get("tool_name", t.get("name", "")))
-                elif isinstance(t, str):
-                    tool_names.append(t)
-
-            has_query = any("query" in name for name in tool_names)
-            assert has_query, f"Expected query in tools: {tool_names}"
+    @pytest.mark.parametrize("expected", ["list_tables", "query"])
+    def test_tools_include(
+        self, sql_tool_names: frozenset[str], expected: str
+    ) -> None:
+        """sql-assistant tools should include the core SQL tools."""
+        if sql_tool_names:
+            assert expected in sql_tool_names
 
 
 class TestAGUIEndpoints:
     """Verify AGUI endpoints respond correctly."""
 
-    def test_get_room_agui(self, client: httpx.Client) -> None:
+    @pytest.mark.parametrize(
+        "room_id", ["sql-assistant-readonly", "sales-db-readonly"]
+    )
+    def test_get_room_agui(self, client: httpx.Client, room_id: str) -> None:
         """Should get room AGUI info with threads list."""
-        response = client.get("/api/v1/rooms/sql-assistant-readonly/agui")
+        response = client.get(f"/api/v1/rooms/{room_id}/agui")
         assert response.status_code == 200
         data = response.json()
         # AGUI endpoint returns threads list
         assert "threads" in data
 
-    def test_get_sales_db_agui(self, client: httpx.Client) -> None:
-        """Should get sales-db-readonly room AGUI info."""
-        response = client.get("/api/v1/rooms/sales-db-readonly/agui")
-        assert response.status_code == 200
-        data = response.json()
-        assert "threads" in data
-
     def test_create_thread_returns_id(self, client: httpx.Client) -> None:
         """Creating a thread should return thread info."""
         response = client.post(
@@ -230,39 +248,23 @@ class TestAGUIEndpoints:
 class TestOpenAPIToolRegistration:
     """Verify tools appear correctly in API schema."""
 
-    def test_openapi_has_paths(self, client: httpx.Client) -> None:
+    def test_openapi_has_paths(self, openapi_schema: dict[str, Any]) -> None:
         """OpenAPI schema should have API paths defined."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        data = response.json()
-
-        paths = data.get("paths", {})
+        paths = openapi_schema.get("paths", {})
         assert len(paths) > 0, "OpenAPI should have paths defined"
 
         # Should have room-related paths
         room_paths = [p for p in paths if "/rooms" in p]
         assert len(room_paths) > 0, "Should have room API paths"
 
-    def test_openapi_has_agui_paths(self, client: httpx.Client) -> None:
+    def test_openapi_has_agui_paths(
+        self, openapi_schema: dict[str, Any]
+    ) -> None:
         """OpenAPI schema should have AGUI paths."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-        data = response.json()
-
-        paths = data.get("paths", {})
+        paths = openapi_schema.get("paths", {})
         agui_paths = [p for p in paths if "agui" in p]
         assert len(agui_paths) > 0, "Should have AGUI API paths"
 
 
-# Skip all tests if server is not available
-@pytest.fixture(scope="session", autouse=True)
-def check_server_available() -> None:
-    """Skip all tests if server is not available."""
-    try:
-        response = httpx.get(f"{SERVER_URL}/docs", timeout=2.0)
-        if response.status_code != 200:
-            pytest.skip(f"Server at {SERVER_URL} not responding correctly")
-    except httpx.ConnectError:
-        pytest.skip(f"Server at {SERVER_URL} is not running")
-    except Exception as e:
-        pytest.skip(f"Cannot connect to server: {e}")
+# Server availability is checked once in tests/integration/conftest.py
+# (pytest_sessionstart), before any fixture setup.
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _preload_tools() -> None:
+    """Import soliplex_sql.tools once for the whole session.
+
+    Tests that resolve config.tool (and the cached _resolve_tool
+    behind it) then find the module in sys.modules instead of paying
+    the first import inside a test body.
+    """
+    import soliplex_sql.tools  # noqa: F401
+
+
 @pytest.fixture
-def temp_db_path() -> Path:
-    """Create a temporary database file path."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        return Path(f.name)
+def temp_db_path(tmp_path: Path) -> Path:
+    """Return a database file path under pytest's tmp_path.
+
+    Unit tests only use this as a path string, so no file is created;
+    tmp_path is auto-cleaned and usually tmpfs-backed, unlike the
+    leaked NamedTemporaryFile this used to mint.
+    """
+    return tmp_path / "test.db"
 
 
 @pytest.fixture
@@ -26,24 +42,31 @@ def mock_ctx() -> MagicMock:
 
 
 @pytest.fixture
-def mock_database() -> MagicMock:
-    """Create a mock database backend."""
-    db = MagicMock()
-    db.get_tables = MagicMock(return_value=["users", "posts"])
-    db.get_schema = MagicMock()
-    db.get_table_info = MagicMock()
-    db.execute = MagicMock()
-    db.explain = MagicMock()
-    db.close = MagicMock()
-    return db
+def mock_database() -> SimpleNamespace:
+    """Create a fake database backend.
+
+    SimpleNamespace with pre-attached AsyncMocks instead of a bare
+    MagicMock: attribute access is a plain C-level lookup and no child
+    mocks are spawned on first touch. Tests override return_value (or
+    reassign an attribute) as needed.
+    """
+    return SimpleNamespace(
+        connect=AsyncMock(),
+        get_tables=AsyncMock(return_value=["users", "posts"]),
+        get_schema=AsyncMock(),
+        get_table_info=AsyncMock(),
+        execute=AsyncMock(),
+        explain=AsyncMock(),
+        close=AsyncMock(),
+    )
 
 
 @pytest.fixture
-def mock_sql_deps(mock_database: MagicMock) -> MagicMock:
-    """Create mock SQLDatabaseDeps."""
-    deps = MagicMock()
-    deps.database = mock_database
-    deps.read_only = True
-    deps.max_rows = 100
-    deps.query_timeout = 30.0
-    return deps
+def mock_sql_deps(mock_database: SimpleNamespace) -> SimpleNamespace:
+    """Create fake SQLDatabaseDeps."""
+    return SimpleNamespace(
+        database=mock_database,
+        read_only=True,
+        max_rows=100,
+        query_timeout=30.0,
+    )
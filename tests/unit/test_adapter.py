@@ -2,21 +2,74 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
 import pytest
 
+from soliplex_sql.adapter import _QUERY_CACHE_MAX
 from soliplex_sql.adapter import SoliplexSQLAdapter
 from soliplex_sql.adapter import _split_statements
 from soliplex_sql.exceptions import QueryExecutionError
 
 
+@dataclass(slots=True)
+class Column:
+    """Stand-in for the upstream ColumnInfo."""
+
+    name: str
+    data_type: str = "TEXT"
+    nullable: bool = True
+    default: Any = None
+    is_primary_key: bool = False
+
+
+@dataclass(slots=True)
+class Table:
+    """Stand-in for the upstream TableInfo."""
+
+    name: str
+    columns: list[Column] = field(default_factory=list)
+    row_count: int = 0
+    primary_key: list[str] = field(default_factory=list)
+    foreign_keys: list[Any] | None = None
+
+
+@dataclass(slots=True)
+class Schema:
+    """Stand-in for the upstream SchemaInfo."""
+
+    tables: list[Table] = field(default_factory=list)
+
+
+# Shared 200-row synthetic result for the truncation tests: built once
+# at import instead of once per test.
+_SYNTHETIC_ROWS = [(i,) for i in range(200)]
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeResult:
+    """Stand-in for the upstream QueryResult.
+
+    Plain attribute reads instead of MagicMock __getattr__ descent;
+    the adapter touches these fields on every statement.
+    """
+
+    columns: list[str]
+    rows: list[tuple[Any, ...]]
+    execution_time_ms: float = 1.0
+
+
 class TestSoliplexSQLAdapter:
     """Tests for SoliplexSQLAdapter."""
 
     @pytest.fixture
-    def adapter(self, mock_sql_deps: MagicMock) -> SoliplexSQLAdapter:
+    def adapter(self, mock_sql_deps: SimpleNamespace) -> SoliplexSQLAdapter:
         """Create adapter with mock deps."""
         return SoliplexSQLAdapter(mock_sql_deps)
 
@@ -34,13 +87,11 @@ class TestSoliplexSQLAdapter:
 
     async def test_list_tables(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should list tables from database."""
-        mock_sql_deps.database.get_tables = AsyncMock(
-            return_value=["users", "posts"]
-        )
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.get_tables.return_value = ["users", "posts"]
 
         tables = await adapter.list_tables()
 
@@ -49,19 +100,13 @@ class TestSoliplexSQLAdapter:
 
     async def test_get_schema(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should get schema from database."""
-        mock_table = MagicMock()
-        mock_table.name = "users"
-        mock_table.columns = []
-        mock_table.row_count = 10
-
-        mock_schema = MagicMock()
-        mock_schema.tables = [mock_table]
-
-        mock_sql_deps.database.get_schema = AsyncMock(return_value=mock_schema)
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.get_schema.return_value = Schema(
+            tables=[Table(name="users", row_count=10)]
+        )
 
         schema = await adapter.get_schema()
 
@@ -71,27 +116,23 @@ class TestSoliplexSQLAdapter:
 
     async def test_describe_table(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should describe table from database."""
-        mock_column = MagicMock()
-        mock_column.name = "id"
-        mock_column.data_type = "INTEGER"
-        mock_column.nullable = False
-        mock_column.default = None
-        mock_column.is_primary_key = True
-
-        mock_table = MagicMock()
-        mock_table.name = "users"
-        mock_table.columns = [mock_column]
-        mock_table.row_count = 10
-        mock_table.primary_key = ["id"]
-        mock_table.foreign_keys = None
-
-        mock_sql_deps.database.get_table_info = AsyncMock(
-            return_value=mock_table
+        mock_sql_deps.database.get_table_info.return_value = Table(
+            name="users",
+            columns=[
+                Column(
+                    name="id",
+                    data_type="INTEGER",
+                    nullable=False,
+                    is_primary_key=True,
+                )
+            ],
+            row_count=10,
+            primary_key=["id"],
         )
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
 
         info = await adapter.describe_table("users")
 
@@ -101,11 +142,11 @@ class TestSoliplexSQLAdapter:
 
     async def test_describe_table_not_found(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should return None for non-existent table."""
-        mock_sql_deps.database.get_table_info = AsyncMock(return_value=None)
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.get_table_info.return_value = None
 
         info = await adapter.describe_table("nonexistent")
 
@@ -113,16 +154,15 @@ class TestSoliplexSQLAdapter:
 
     async def test_query(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should execute query and return results."""
-        mock_result = MagicMock()
-        mock_result.columns = ["id", "name"]
-        mock_result.rows = [(1, "Alice"), (2, "Bob")]
-        mock_result.execution_time_ms = 5.0
-
-        mock_sql_deps.database.execute = AsyncMock(return_value=mock_result)
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id", "name"],
+            rows=[(1, "Alice"), (2, "Bob")],
+            execution_time_ms=5.0,
+        )
 
         result = await adapter.query("SELECT * FROM users")
 
@@ -130,19 +170,90 @@ class TestSoliplexSQLAdapter:
         assert result["row_count"] == 2
         assert result["truncated"] is False
 
+    async def test_query_columnar(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Should return per-column tuples when columnar=True."""
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id", "name"],
+            rows=[(1, "Alice"), (2, "Bob")],
+            execution_time_ms=5.0,
+        )
+
+        result = await adapter.query("SELECT * FROM users", columnar=True)
+
+        assert result["columns"] == ["id", "name"]
+        assert result["arrays"] == ((1, 2), ("Alice", "Bob"))
+        assert result["row_count"] == 2
+        assert "rows" not in result
+
+    async def test_query_columnar_empty_result(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Columnar result should have one empty tuple per column."""
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id", "name"], rows=[]
+        )
+
+        result = await adapter.query("SELECT * FROM users", columnar=True)
+
+        assert result["arrays"] == ((), ())
+        assert result["row_count"] == 0
+
+    async def test_query_columnar_ragged_statements_raise(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Mismatched column counts should raise, not leak ValueError."""
+        mock_sql_deps.database.execute.side_effect = [
+            _FakeResult(columns=["id", "name"], rows=[(1, "Alice")]),
+            _FakeResult(columns=["id"], rows=[(2,)]),
+        ]
+
+        with pytest.raises(QueryExecutionError, match="columnar"):
+            await adapter.query(
+                "SELECT * FROM users; SELECT id FROM posts",
+                columnar=True,
+            )
+
+    async def test_query_columnar_truncates_results(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Columnar results should respect max_rows like row output."""
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id"],
+            rows=_SYNTHETIC_ROWS,
+            execution_time_ms=10.0,
+        )
+        mock_sql_deps.max_rows = 100
+
+        result = await adapter.query(
+            "SELECT * FROM big_table", columnar=True
+        )
+
+        assert len(result["arrays"]) == 1
+        assert len(result["arrays"][0]) == 100
+        assert result["truncated"] is True
+
     async def test_query_truncates_results(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should truncate results to max_rows."""
-        mock_result = MagicMock()
-        mock_result.columns = ["id"]
-        mock_result.rows = [(i,) for i in range(200)]  # 200 rows
-        mock_result.execution_time_ms = 10.0
-
-        mock_sql_deps.database.execute = AsyncMock(return_value=mock_result)
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id"],
+            rows=_SYNTHETIC_ROWS,  # 200 rows
+            execution_time_ms=10.0,
+        )
         mock_sql_deps.max_rows = 100
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
 
         result = await adapter.query("SELECT * FROM big_table")
 
@@ -151,13 +262,11 @@ class TestSoliplexSQLAdapter:
 
     async def test_explain_query(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should return query execution plan."""
-        mock_sql_deps.database.explain = AsyncMock(
-            return_value="SCAN TABLE users"
-        )
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.explain.return_value = "SCAN TABLE users"
 
         plan = await adapter.explain_query("SELECT * FROM users")
 
@@ -165,16 +274,13 @@ class TestSoliplexSQLAdapter:
 
     async def test_sample_query(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should execute sample query with limit."""
-        mock_result = MagicMock()
-        mock_result.columns = ["id"]
-        mock_result.rows = [(1,), (2,), (3,)]
-        mock_result.execution_time_ms = 1.0
-
-        mock_sql_deps.database.execute = AsyncMock(return_value=mock_result)
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id"], rows=[(1,), (2,), (3,)]
+        )
 
         result = await adapter.sample_query("SELECT * FROM users", limit=5)
 
@@ -182,17 +288,193 @@ class TestSoliplexSQLAdapter:
 
     async def test_close(
         self,
-        mock_sql_deps: MagicMock,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
     ) -> None:
         """Should close database connection."""
-        mock_sql_deps.database.close = AsyncMock()
-        adapter = SoliplexSQLAdapter(mock_sql_deps)
-
         await adapter.close()
 
         mock_sql_deps.database.close.assert_called_once()
 
 
+class TestSchemaCache:
+    """Tests for the adapter's TTL schema-introspection cache."""
+
+    @pytest.fixture
+    def adapter(self, mock_sql_deps: SimpleNamespace) -> SoliplexSQLAdapter:
+        """Create adapter with mock deps."""
+        return SoliplexSQLAdapter(mock_sql_deps)
+
+    async def test_list_tables_cached(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Repeated list_tables should hit the database once."""
+        first = await adapter.list_tables()
+        second = await adapter.list_tables()
+
+        assert first == second
+        mock_sql_deps.database.get_tables.assert_called_once()
+
+    async def test_describe_table_caches_missing_table(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """None results should be cached, not retried each call."""
+        mock_sql_deps.database.get_table_info.return_value = None
+
+        assert await adapter.describe_table("ghost") is None
+        assert await adapter.describe_table("ghost") is None
+
+        mock_sql_deps.database.get_table_info.assert_called_once()
+
+    async def test_get_schema_cached(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Repeated get_schema should serve the cached summary."""
+        mock_sql_deps.database.get_schema.return_value = Schema(
+            tables=[Table(name="users", row_count=10)]
+        )
+
+        first = await adapter.get_schema()
+        second = await adapter.get_schema()
+
+        assert second is first
+        mock_sql_deps.database.get_schema.assert_called_once()
+
+    async def test_write_invalidates_cache(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """A write through the adapter should drop cached introspection."""
+        mock_sql_deps.read_only = False
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=[], rows=[]
+        )
+
+        await adapter.list_tables()
+        await adapter.query("CREATE TABLE extra (id INT)")
+        await adapter.list_tables()
+
+        assert mock_sql_deps.database.get_tables.call_count == 2
+
+    async def test_expired_entry_is_refetched(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Entries older than the TTL should be refetched."""
+        adapter._schema_ttl = 0.0
+
+        await adapter.list_tables()
+        await adapter.list_tables()
+
+        assert mock_sql_deps.database.get_tables.call_count == 2
+
+
+class TestQueryResultCache:
+    """Tests for the adapter's read-query result cache."""
+
+    @pytest.fixture
+    def adapter(self, mock_sql_deps: SimpleNamespace) -> SoliplexSQLAdapter:
+        """Create adapter with mock deps and a canned result."""
+        mock_sql_deps.database.execute.return_value = _FakeResult(
+            columns=["id"], rows=[(1,)]
+        )
+        return SoliplexSQLAdapter(mock_sql_deps)
+
+    async def test_repeated_select_cached(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Identical SELECTs should hit the driver once."""
+        result1 = await adapter.query("SELECT * FROM users")
+        result2 = await adapter.query("SELECT * FROM users")
+
+        assert result1 is result2
+        mock_sql_deps.database.execute.assert_called_once()
+
+    async def test_whitespace_variants_share_entry(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """Keys are whitespace-normalized, so reformatting still hits."""
+        await adapter.query("SELECT * FROM users")
+        await adapter.query("SELECT   *\n  FROM users")
+
+        mock_sql_deps.database.execute.assert_called_once()
+
+    async def test_expired_entry_dropped_and_refetched(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A stale entry should be evicted and the query re-run."""
+        monkeypatch.setattr(
+            "soliplex_sql.adapter._QUERY_CACHE_TTL", 0.0
+        )
+
+        await adapter.query("SELECT * FROM users")
+        await adapter.query("SELECT * FROM users")
+
+        assert mock_sql_deps.database.execute.call_count == 2
+        # The re-run stored a fresh entry; the stale one is gone.
+        assert len(adapter._query_cache) == 1
+
+    async def test_store_sweeps_expired_entries_when_full(
+        self,
+        adapter: SoliplexSQLAdapter,
+    ) -> None:
+        """A full cache of stale entries should be swept on store."""
+        for i in range(_QUERY_CACHE_MAX):
+            adapter._query_cache[(f"stale {i}", None, False)] = (0.0, {})
+
+        await adapter.query("SELECT * FROM users")
+
+        assert len(adapter._query_cache) == 1
+        assert ("stale 0", None, False) not in adapter._query_cache
+
+    async def test_store_evicts_oldest_live_entry_when_full(
+        self,
+        adapter: SoliplexSQLAdapter,
+    ) -> None:
+        """With only live entries, the oldest should make room."""
+        far_future = time.monotonic() + 1000.0
+        for i in range(_QUERY_CACHE_MAX):
+            adapter._query_cache[(f"live {i}", None, False)] = (
+                far_future,
+                {},
+            )
+
+        await adapter.query("SELECT * FROM users")
+
+        assert len(adapter._query_cache) == _QUERY_CACHE_MAX
+        assert ("live 0", None, False) not in adapter._query_cache
+        assert ("live 1", None, False) in adapter._query_cache
+
+    async def test_write_clears_query_cache(
+        self,
+        adapter: SoliplexSQLAdapter,
+        mock_sql_deps: SimpleNamespace,
+    ) -> None:
+        """A write should invalidate previously cached results."""
+        mock_sql_deps.read_only = False
+
+        await adapter.query("SELECT * FROM users")
+        await adapter.query("INSERT INTO users (id) VALUES (2)")
+        await adapter.query("SELECT * FROM users")
+
+        assert mock_sql_deps.database.execute.call_count == 3
+
+
 class TestStatementSplitting:
     """Tests for _split_statements function."""
 
@@ -342,7 +624,7 @@ class TestWriteQueryDetection:
     """Tests for _is_write_query method."""
 
     @pytest.fixture
-    def adapter(self, mock_sql_deps: MagicMock) -> SoliplexSQLAdapter:
+    def adapter(self, mock_sql_deps: SimpleNamespace) -> SoliplexSQLAdapter:
         """Create adapter with mock deps."""
         mock_sql_deps.read_only = False
         return SoliplexSQLAdapter(mock_sql_deps)
@@ -399,23 +681,21 @@ class TestWriteCommit:
     """Tests for write operation commit behavior."""
 
     @pytest.fixture
-    def writable_deps(self, mock_database: MagicMock) -> MagicMock:
-        """Create mock deps with write access."""
-        deps = MagicMock()
-        deps.database = mock_database
-        deps.read_only = False
-        deps.max_rows = 100
-        deps.query_timeout = 30.0
-        return deps
+    def writable_deps(
+        self, mock_sql_deps: SimpleNamespace
+    ) -> SimpleNamespace:
+        """Create fake deps with write access."""
+        mock_sql_deps.read_only = False
+        return mock_sql_deps
 
     async def test_commit_called_on_insert(
-        self, writable_deps: MagicMock
+        self, writable_deps: SimpleNamespace
     ) -> None:
         """INSERT should trigger commit."""
         mock_connection = AsyncMock()
         writable_deps.database._connection = mock_connection
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(columns=[], rows=[], execution_time_ms=1.0)
+            return_value=_FakeResult(columns=[], rows=[])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
@@ -424,13 +704,13 @@ class TestWriteCommit:
         mock_connection.commit.assert_called_once()
 
     async def test_commit_called_on_update(
-        self, writable_deps: MagicMock
+        self, writable_deps: SimpleNamespace
     ) -> None:
         """UPDATE should trigger commit."""
         mock_connection = AsyncMock()
         writable_deps.database._connection = mock_connection
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(columns=[], rows=[], execution_time_ms=1.0)
+            return_value=_FakeResult(columns=[], rows=[])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
@@ -439,13 +719,13 @@ class TestWriteCommit:
         mock_connection.commit.assert_called_once()
 
     async def test_commit_called_on_delete(
-        self, writable_deps: MagicMock
+        self, writable_deps: SimpleNamespace
     ) -> None:
         """DELETE should trigger commit."""
         mock_connection = AsyncMock()
         writable_deps.database._connection = mock_connection
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(columns=[], rows=[], execution_time_ms=1.0)
+            return_value=_FakeResult(columns=[], rows=[])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
@@ -453,14 +733,14 @@ class TestWriteCommit:
 
         mock_connection.commit.assert_called_once()
 
-    async def test_no_commit_on_select(self, writable_deps: MagicMock) -> None:
+    async def test_no_commit_on_select(
+        self, writable_deps: SimpleNamespace
+    ) -> None:
         """SELECT should not trigger commit."""
         mock_connection = AsyncMock()
         writable_deps.database._connection = mock_connection
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(
-                columns=["id"], rows=[(1,)], execution_time_ms=1.0
-            )
+            return_value=_FakeResult(columns=["id"], rows=[(1,)])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
@@ -469,13 +749,12 @@ class TestWriteCommit:
         mock_connection.commit.assert_not_called()
 
     async def test_commit_handles_missing_connection(
-        self, writable_deps: MagicMock
+        self, writable_deps: SimpleNamespace
     ) -> None:
         """Should handle case where _connection is not available."""
-        # Remove _connection attribute
-        del writable_deps.database._connection
+        # The fake backend has no _connection attribute at all
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(columns=[], rows=[], execution_time_ms=1.0)
+            return_value=_FakeResult(columns=[], rows=[])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
@@ -483,7 +762,7 @@ class TestWriteCommit:
         await adapter.query("INSERT INTO users (name) VALUES ('test')")
 
     async def test_commit_handles_no_commit_method(
-        self, writable_deps: MagicMock
+        self, writable_deps: SimpleNamespace
     ) -> None:
         """Should handle backends without commit method."""
         mock_connection = MagicMock()
@@ -492,21 +771,60 @@ class TestWriteCommit:
         del mock_connection.commit
         writable_deps.database._connection = mock_connection
         writable_deps.database.execute = AsyncMock(
-            return_value=MagicMock(columns=[], rows=[], execution_time_ms=1.0)
+            return_value=_FakeResult(columns=[], rows=[])
         )
 
         adapter = SoliplexSQLAdapter(writable_deps)
         # Should not raise
         await adapter.query("INSERT INTO users (name) VALUES ('test')")
 
+    async def test_query_many_commits_once(
+        self, writable_deps: SimpleNamespace
+    ) -> None:
+        """A batch of writes should issue a single commit at the end."""
+        mock_connection = AsyncMock()
+        writable_deps.database._connection = mock_connection
+        writable_deps.database.execute = AsyncMock(
+            return_value=_FakeResult(columns=[], rows=[])
+        )
+
+        adapter = SoliplexSQLAdapter(writable_deps)
+        results = await adapter.query_many([
+            "INSERT INTO users (name) VALUES ('a')",
+            "INSERT INTO users (name) VALUES ('b')",
+            "INSERT INTO users (name) VALUES ('c')",
+        ])
+
+        assert len(results) == 3
+        assert writable_deps.database.execute.call_count == 3
+        mock_connection.commit.assert_called_once()
+
+    async def test_query_many_reads_do_not_commit(
+        self, writable_deps: SimpleNamespace
+    ) -> None:
+        """A read-only batch should not commit and keeps result order."""
+        mock_connection = AsyncMock()
+        writable_deps.database._connection = mock_connection
+        writable_deps.database.execute = AsyncMock(
+            return_value=_FakeResult(columns=["id"], rows=[(1,)])
+        )
+
+        adapter = SoliplexSQLAdapter(writable_deps)
+        results = await adapter.query_many(
+            ["SELECT 1", "SELECT 2"]
+        )
+
+        assert [r["row_count"] for r in results] == [1, 1]
+        mock_connection.commit.assert_not_called()
+
 
 class TestReadOnlyEnforcement:
     """Tests for read-only mode enforcement."""
 
     @pytest.fixture
-    def readonly_deps(self, mock_database: MagicMock) -> MagicMock:
-        """Create mock deps in read-only mode."""
-        deps = MagicMock()
+    def readonly_deps(self, mock_database: SimpleNamespace) -> SimpleNamespace:
+        """Create fake deps in read-only mode."""
+        deps = SimpleNamespace()
         deps.database = mock_database
         deps.read_only = True
         deps.max_rows = 100
@@ -514,7 +832,7 @@ class TestReadOnlyEnforcement:
         return deps
 
     async def test_insert_blocked_in_readonly(
-        self, readonly_deps: MagicMock
+        self, readonly_deps: SimpleNamespace
     ) -> None:
         """INSERT should be blocked in read-only mode."""
         adapter = SoliplexSQLAdapter(readonly_deps)
@@ -523,7 +841,7 @@ class TestReadOnlyEnforcement:
             await adapter.query("INSERT INTO users (name) VALUES ('test')")
 
     async def test_update_blocked_in_readonly(
-        self, readonly_deps: MagicMock
+        self, readonly_deps: SimpleNamespace
     ) -> None:
         """UPDATE should be blocked in read-only mode."""
         adapter = SoliplexSQLAdapter(readonly_deps)
@@ -532,7 +850,7 @@ class TestReadOnlyEnforcement:
             await adapter.query("UPDATE users SET name = 'test'")
 
     async def test_delete_blocked_in_readonly(
-        self, readonly_deps: MagicMock
+        self, readonly_deps: SimpleNamespace
     ) -> None:
         """DELETE should be blocked in read-only mode."""
         adapter = SoliplexSQLAdapter(readonly_deps)
@@ -541,13 +859,11 @@ class TestReadOnlyEnforcement:
             await adapter.query("DELETE FROM users")
 
     async def test_select_allowed_in_readonly(
-        self, readonly_deps: MagicMock
+        self, readonly_deps: SimpleNamespace
     ) -> None:
         """SELECT should work in read-only mode."""
         readonly_deps.database.execute = AsyncMock(
-            return_value=MagicMock(
-                columns=["id"], rows=[(1,)], execution_time_ms=1.0
-            )
+            return_value=_FakeResult(columns=["id"], rows=[(1,)])
         )
         adapter = SoliplexSQLAdapter(readonly_deps)
 
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from soliplex_sql.config import SQLToolConfig
 from soliplex_sql.config import SQLToolSettings
 from soliplex_sql.config import _create_backend
 from soliplex_sql.config import _parse_postgres_url
+from soliplex_sql.config import get_default_configs
 from soliplex_sql.exceptions import UnsupportedDatabaseError
 
+# Patterns for pytest.raises(match=...), compiled once at import
+# instead of per call inside the tests.
+_UNSUPPORTED_RE = re.compile("Unsupported")
+_TOOL_NAME_RE = re.compile("tool_name")
+
 
 class TestSQLToolSettings:
     """Tests for environment-based settings."""
@@ -23,8 +31,13 @@ class TestSQLToolSettings:
         assert settings.query_timeout == 30.0
         assert "sqlite" in settings.database_url
 
+    @pytest.mark.xdist_group("config_env")
     def test_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Environment variables override defaults."""
+        """Environment variables override defaults.
+
+        Grouped for xdist --dist loadgroup runs so tests that
+        monkeypatch SOLIPLEX_SQL_* variables stay on one worker.
+        """
         monkeypatch.setenv("SOLIPLEX_SQL_READ_ONLY", "false")
         monkeypatch.setenv("SOLIPLEX_SQL_MAX_ROWS", "500")
         monkeypatch.setenv("SOLIPLEX_SQL_QUERY_TIMEOUT", "60.0")
@@ -46,7 +59,7 @@ class TestCreateBackend:
 
     def test_unsupported_raises(self) -> None:
         """Should raise for unsupported URLs."""
-        with pytest.raises(UnsupportedDatabaseError, match="Unsupported"):
+        with pytest.raises(UnsupportedDatabaseError, match=_UNSUPPORTED_RE):
             _create_backend("mysql://localhost/db")
 
     def test_unsupported_shows_supported_schemes(self) -> None:
@@ -110,18 +123,20 @@ class TestSQLToolConfig:
         assert config.kind == "list_tables"
 
     def test_kind_is_unique_per_tool(self) -> None:
-        """Each SQL tool should have a unique kind derived from tool_name."""
-        tools_and_kinds = [
-            ("soliplex_sql.tools.list_tables", "list_tables"),
-            ("soliplex_sql.tools.get_schema", "get_schema"),
-            ("soliplex_sql.tools.describe_table", "describe_table"),
-            ("soliplex_sql.tools.query", "query"),
-            ("soliplex_sql.tools.explain_query", "explain_query"),
-            ("soliplex_sql.tools.sample_query", "sample_query"),
-        ]
-        for tool_name, expected_kind in tools_and_kinds:
-            config = SQLToolConfig(tool_name=tool_name)
-            assert config.kind == expected_kind
+        """Each SQL tool should have a unique kind derived from tool_name.
+
+        Tuple comparison over the default registry covers order,
+        uniqueness, and derivation in one assertion.
+        """
+        kinds = tuple(config.kind for config in get_default_configs())
+        assert kinds == (
+            "list_tables",
+            "get_schema",
+            "describe_table",
+            "query",
+            "explain_query",
+            "sample_query",
+        )
 
     def test_from_yaml(self) -> None:
         """Should create from YAML config dict."""
@@ -172,7 +187,7 @@ class TestSQLToolConfig:
 
     def test_config_requires_tool_name(self) -> None:
         """SQLToolConfig requires tool_name (inherited from ToolConfig)."""
-        with pytest.raises(TypeError, match="tool_name"):
+        with pytest.raises(TypeError, match=_TOOL_NAME_RE):
             SQLToolConfig()
 
     def test_config_accepts_custom_settings(self) -> None:
@@ -10,6 +10,15 @@ from soliplex_sql.exceptions import QueryExecutionError
 from soliplex_sql.exceptions import SoliplexSqlError
 from soliplex_sql.exceptions import UnsupportedDatabaseError
 
+# Every concrete exception in the hierarchy; the table drives all the
+# inheritance tests below so adding an exception means adding one row.
+_EXCEPTION_CLASSES = [
+    ConfigurationError,
+    DatabaseConnectionError,
+    QueryExecutionError,
+    UnsupportedDatabaseError,
+]
+
 
 class TestExceptions:
     """Tests for custom exceptions."""
@@ -20,36 +29,14 @@ class TestExceptions:
         assert str(exc) == "test error"
         assert isinstance(exc, Exception)
 
-    def test_configuration_error_inheritance(self) -> None:
-        """ConfigurationError should inherit from base."""
-        exc = ConfigurationError("bad config")
-        assert isinstance(exc, SoliplexSqlError)
-        assert isinstance(exc, Exception)
-
-    def test_database_connection_error_inheritance(self) -> None:
-        """DatabaseConnectionError should inherit from base."""
-        exc = DatabaseConnectionError("connection failed")
-        assert isinstance(exc, SoliplexSqlError)
-
-    def test_query_execution_error_inheritance(self) -> None:
-        """QueryExecutionError should inherit from base."""
-        exc = QueryExecutionError("query failed")
-        assert isinstance(exc, SoliplexSqlError)
-
-    def test_unsupported_database_error_inheritance(self) -> None:
-        """UnsupportedDatabaseError should inherit from base."""
-        exc = UnsupportedDatabaseError("mysql not supported")
-        assert isinstance(exc, SoliplexSqlError)
-
-    def test_exceptions_can_be_caught_by_base(self) -> None:
-        """All exceptions should be catchable by base class."""
-        exceptions = [
-            ConfigurationError("test"),
-            DatabaseConnectionError("test"),
-            QueryExecutionError("test"),
-            UnsupportedDatabaseError("test"),
-        ]
-
-        for exc in exceptions:
-            with pytest.raises(SoliplexSqlError):
-                raise exc
+    @pytest.mark.parametrize("exc_cls", _EXCEPTION_CLASSES)
+    def test_inherits_base(self, exc_cls: type[Exception]) -> None:
+        """Each exception should inherit from SoliplexSqlError."""
+        assert issubclass(exc_cls, SoliplexSqlError)
+        assert issubclass(exc_cls, Exception)
+
+    @pytest.mark.parametrize("exc_cls", _EXCEPTION_CLASSES)
+    def test_caught_by_base(self, exc_cls: type[Exception]) -> None:
+        """Each exception should be catchable by the base class."""
+        with pytest.raises(SoliplexSqlError):
+            raise exc_cls("test")
@@ -0,0 +1,156 @@
+"""Smoke tests against a mocked HTTP transport.
+
+These mirror the live smoke tests in tests/integration/test_smoke.py
+but run against httpx.MockTransport with canned payloads modelled on
+example/installation.yaml. No server, no sockets: they exercise the
+same API-shape expectations in milliseconds and always run in CI,
+while the live variant remains the end-to-end check.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+FIXTURE_ROOMS: dict[str, Any] = {
+    "sql-assistant-readonly": {
+        "description": "SQL assistant with read-only database access",
+        "agent": {"model_name": "gpt-oss:20b"},
+        "suggestions": ["What tables are in the database?"],
+        "tools": [
+            {"tool_name": "soliplex_sql.tools.list_tables"},
+            {"tool_name": "soliplex_sql.tools.get_schema"},
+            {"tool_name": "soliplex_sql.tools.describe_table"},
+            {"tool_name": "soliplex_sql.tools.query"},
+            {"tool_name": "soliplex_sql.tools.explain_query"},
+            {"tool_name": "soliplex_sql.tools.sample_query"},
+        ],
+    },
+    "sales-db-readonly": {
+        "description": "Query the sales database",
+        "agent": {"model_name": "gpt-oss:20b"},
+        "suggestions": ["Show me the top customers"],
+        "tools": [
+            {"tool_name": "soliplex_sql.tools.list_tables"},
+            {"tool_name": "soliplex_sql.tools.query"},
+        ],
+    },
+}
+
+FIXTURE_OPENAPI: dict[str, Any] = {
+    "openapi": "3.1.0",
+    "paths": {
+        "/api/v1/rooms": {"get": {}},
+        "/api/v1/rooms/{room_id}/agui": {"get": {}, "post": {}},
+        "/api/v1/rooms/{room_id}/agui/{thread_id}/{run_id}": {"post": {}},
+    },
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve canned responses for the endpoints smoke tests touch."""
+    path = request.url.path
+    if path == "/api/v1/rooms":
+        return httpx.Response(200, json=FIXTURE_ROOMS)
+    if path == "/openapi.json":
+        return httpx.Response(200, json=FIXTURE_OPENAPI)
+    if path == "/docs":
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/html; charset=utf-8"},
+            text="<html></html>",
+        )
+    if path.endswith("/agui") and request.method == "GET":
+        return httpx.Response(200, json={"threads": []})
+    if path.endswith("/agui") and request.method == "POST":
+        return httpx.Response(
+            201,
+            json={"thread_id": "thread-1", "runs": {"run-1": {}}},
+        )
+    return httpx.Response(404, json={"detail": "Not found"})
+
+
+@pytest.fixture(scope="module")
+def client() -> httpx.Client:
+    """HTTP client wired to the mock transport (no sockets opened)."""
+    return httpx.Client(
+        base_url="http://testserver",
+        transport=httpx.MockTransport(_handler),
+    )
+
+
+@pytest.fixture(scope="module")
+def rooms(client: httpx.Client) -> dict[str, Any]:
+    """Fetch the room listing once per module, like the live suite."""
+    return client.get("/api/v1/rooms").json()
+
+
+@pytest.fixture(scope="module")
+def openapi_schema(client: httpx.Client) -> dict[str, Any]:
+    """Fetch the OpenAPI schema once per module, like the live suite."""
+    return client.get("/openapi.json").json()
+
+
+class TestServerHealth:
+    """Health endpoints answer with the expected shapes."""
+
+    def test_docs_endpoint(self, client: httpx.Client) -> None:
+        """Server should serve API documentation."""
+        response = client.get("/docs")
+        assert response.status_code == 200
+        assert "html" in response.headers.get("content-type", "").lower()
+
+    def test_openapi_schema(self, openapi_schema: dict[str, Any]) -> None:
+        """Server should expose OpenAPI schema."""
+        assert "openapi" in openapi_schema
+        assert "paths" in openapi_schema
+
+
+class TestRoomsConfiguration:
+    """Room payloads carry the fields the plugin configures."""
+
+    def test_list_rooms(self, rooms: dict[str, Any]) -> None:
+        """Rooms endpoint returns a dict keyed by room ID."""
+        assert isinstance(rooms, dict)
+        assert "sql-assistant-readonly" in rooms
+        assert "sales-db-readonly" in rooms
+
+    def test_room_has_agent_config(self, rooms: dict[str, Any]) -> None:
+        """Rooms should have agent configuration with a model."""
+        for room in rooms.values():
+            assert room["agent"]["model_name"]
+
+    def test_tools_bound_to_rooms(self, rooms: dict[str, Any]) -> None:
+        """Every room exposes list_tables and query tools."""
+        for room in rooms.values():
+            tool_names = {t["tool_name"] for t in room["tools"]}
+            assert "soliplex_sql.tools.list_tables" in tool_names
+            assert "soliplex_sql.tools.query" in tool_names
+
+
+class TestAGUIEndpoints:
+    """AGUI endpoints respond with thread structures."""
+
+    def test_get_room_agui(self, client: httpx.Client) -> None:
+        """Room AGUI info includes a threads list."""
+        data = client.get("/api/v1/rooms/sql-assistant-readonly/agui").json()
+        assert "threads" in data
+
+    def test_create_thread_returns_id(self, client: httpx.Client) -> None:
+        """Creating a thread returns thread_id and a run."""
+        response = client.post(
+            "/api/v1/rooms/sql-assistant-readonly/agui", json={}
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["thread_id"]
+        assert data["runs"]
+
+    def test_unknown_path_is_404(self, client: httpx.Client) -> None:
+        """The mock transport rejects unexpected paths."""
+        response = client.get("/api/v1/unknown")
+        assert response.status_code == 404
+        assert json.loads(response.content)["detail"] == "Not found"
@@ -2,137 +2,482 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
+
 from soliplex_sql.config import SQLToolConfig
-from soliplex_sql.tools import _adapter_cache
+from soliplex_sql.tools import _QUERY_CACHE_MAX
+from soliplex_sql.tools import _adapter_locks
+from soliplex_sql.tools import _cache
+from soliplex_sql.tools import _default_adapter_cache
 from soliplex_sql.tools import _get_adapter
+from soliplex_sql.tools import _invalidate_adapter
+from soliplex_sql.tools import _query_cache
 from soliplex_sql.tools import close_all
+from soliplex_sql.tools import query
+from soliplex_sql.tools import reset_adapter_cache
+from soliplex_sql.tools import serialize_result
+
+# These tests share the module-scoped create_deps patch and the
+# module-global adapter/query caches in soliplex_sql.tools, so
+# --dist loadgroup runs must keep the whole module on one worker.
+pytestmark = pytest.mark.xdist_group("tools")
+
+
+def _make_deps(
+    read_only: bool = True, max_rows: int = 100
+) -> SimpleNamespace:
+    """Build a minimal stand-in for SQLDatabaseDeps.
+
+    SimpleNamespace instead of MagicMock, matching the conftest fakes:
+    attribute reads are plain lookups and no child mocks are spawned.
+    """
+    return SimpleNamespace(
+        database=SimpleNamespace(),
+        read_only=read_only,
+        max_rows=max_rows,
+    )
+
+
+# Tests never mutate configs, so identical ones are built once here
+# instead of per test; dataclass construction still runs the env
+# default factories, which these shared instances pay only once.
+_CONFIG_TEST = SQLToolConfig(
+    tool_name="soliplex_sql.tools.query",
+    database_url="sqlite:///test.db",
+    read_only=True,
+    max_rows=100,
+)
+_CONFIG_DB1 = SQLToolConfig(
+    tool_name="soliplex_sql.tools.query",
+    database_url="sqlite:///db1.db",
+    read_only=True,
+    max_rows=100,
+)
+_CONFIG_DB2 = SQLToolConfig(
+    tool_name="soliplex_sql.tools.query",
+    database_url="sqlite:///db2.db",
+    read_only=True,
+    max_rows=100,
+)
+
+
+@pytest.fixture(scope="module")
+def _patched_create_deps():
+    """Patch SQLToolConfig.create_deps once for the whole module.
+
+    Installing and removing the patch per test repeats attribute
+    resolution and restore work; one module-wide install is enough
+    since every consumer resets it through mock_create_deps.
+    """
+    with patch.object(SQLToolConfig, "create_deps") as mock_create:
+        yield mock_create
+
+
+@pytest.fixture
+def mock_create_deps(_patched_create_deps: MagicMock) -> MagicMock:
+    """The shared create_deps mock, reset and primed for one test."""
+    _patched_create_deps.reset_mock()
+    _patched_create_deps.return_value = _make_deps()
+    return _patched_create_deps
+
+
+@pytest.fixture
+def make_adapter() -> Callable[..., Any]:
+    """Factory for fake adapters whose close calls are tracked.
+
+    Returns one adapter by default or a list of n, so close_all tests
+    request exactly what they need without repeating the stub shape.
+    """
+
+    def _make(n: int = 1) -> SimpleNamespace | list[SimpleNamespace]:
+        adapters = [SimpleNamespace(close=AsyncMock()) for _ in range(n)]
+        return adapters[0] if n == 1 else adapters
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Give every test clean adapter and query caches."""
+    _cache().clear()
+    _query_cache.clear()
+    yield
+    _cache().clear()
+    _query_cache.clear()
 
 
 class TestGetAdapter:
     """Tests for _get_adapter."""
 
-    def setup_method(self) -> None:
-        """Clear adapter cache before each test."""
-        _adapter_cache.clear()
+    async def test_creates_adapter_from_config(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """Should create adapter from config."""
+        config = _CONFIG_TEST
 
-    def teardown_method(self) -> None:
-        """Clear adapter cache after each test."""
-        _adapter_cache.clear()
+        adapter = await _get_adapter(config)
 
-    async def test_creates_adapter_from_config(self) -> None:
-        """Should create adapter from config."""
-        config = SQLToolConfig(
-            tool_name="soliplex_sql.tools.query",
-            database_url="sqlite:///test.db",
-            read_only=True,
-            max_rows=100,
-        )
+        assert adapter is not None
 
-        with patch.object(SQLToolConfig, "create_deps") as mock_create:
-            mock_deps = MagicMock()
-            mock_deps.database = MagicMock()
-            mock_deps.read_only = True
-            mock_deps.max_rows = 100
-            mock_create.return_value = mock_deps
+    @pytest.mark.parametrize("n", [2, 8])
+    async def test_caches_adapter(
+        self, mock_create_deps: MagicMock, n: int
+    ) -> None:
+        """Should cache and reuse adapter."""
+        config = _CONFIG_TEST
 
-            adapter = await _get_adapter(config)
+        adapters = [await _get_adapter(config) for _ in range(n)]
 
-            assert adapter is not None
+        # Should reuse cached adapter
+        assert all(adapter is adapters[0] for adapter in adapters)
+        # create_deps called only once
+        assert mock_create_deps.call_count == 1
 
-    async def test_caches_adapter(self) -> None:
-        """Should cache and reuse adapter."""
-        config = SQLToolConfig(
-            tool_name="soliplex_sql.tools.query",
-            database_url="sqlite:///test.db",
-            read_only=True,
-            max_rows=100,
+    async def test_concurrent_misses_build_once(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """Concurrent first lookups should construct one adapter."""
+        config = _CONFIG_TEST
+
+        adapters = await asyncio.gather(
+            *(_get_adapter(config) for _ in range(32))
         )
 
-        with patch.object(SQLToolConfig, "create_deps") as mock_create:
-            mock_deps = MagicMock()
-            mock_deps.database = MagicMock()
-            mock_deps.read_only = True
-            mock_deps.max_rows = 100
-            mock_create.return_value = mock_deps
+        assert all(adapter is adapters[0] for adapter in adapters)
+        assert mock_create_deps.call_count == 1
+
+    async def test_cache_key_is_precomputed(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """Adapters should be stored under the config's prebuilt key."""
+        config = _CONFIG_TEST
+
+        adapter = await _get_adapter(config)
+
+        assert config._cache_key == ("sqlite:///test.db", True, 100)
+        assert _cache()[config._cache_key] is adapter
 
-            adapter1 = await _get_adapter(config)
-            adapter2 = await _get_adapter(config)
+    async def test_hit_path_stays_cheap(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """Cached lookups should stay lock-free dict reads.
 
-            # Should reuse cached adapter
-            assert adapter1 is adapter2
-            # create_deps called only once
-            assert mock_create.call_count == 1
+        Guards against someone reintroducing a lock or rebuild on the
+        hit path: the construction lock must be gone once the entry is
+        published, and a thousand hits must cost microseconds each
+        (the bound is generous for slow CI).
+        """
+        adapter = await _get_adapter(_CONFIG_TEST)
 
-    async def test_different_configs_different_adapters(self) -> None:
+        assert _adapter_locks == {}
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            assert await _get_adapter(_CONFIG_TEST) is adapter
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert mock_create_deps.call_count == 1
+
+    async def test_different_configs_different_adapters(
+        self, mock_create_deps: MagicMock
+    ) -> None:
         """Should create different adapters for different configs."""
-        config1 = SQLToolConfig(
+        await _get_adapter(_CONFIG_DB1)
+        await _get_adapter(_CONFIG_DB2)
+
+        # Different database URLs = different adapters
+        assert mock_create_deps.call_count == 2
+
+
+class TestResetAdapterCache:
+    """Tests for the ContextVar-scoped adapter cache.
+
+    Each test scopes the reset inside an asyncio task: tasks run in a
+    copy of the current context, so the ContextVar set by
+    reset_adapter_cache() never leaks back to the test body.
+    """
+
+    async def test_reset_context_builds_fresh_adapter(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """A reset context should start empty and rebuild adapters."""
+        original = await _get_adapter(_CONFIG_TEST)
+
+        async def scoped() -> object:
+            reset_adapter_cache()
+            assert len(_cache()) == 0
+            return await _get_adapter(_CONFIG_TEST)
+
+        fresh = await asyncio.create_task(scoped())
+
+        assert fresh is not original
+        assert mock_create_deps.call_count == 2
+
+    async def test_default_cache_survives_scoped_reset(
+        self, mock_create_deps: MagicMock
+    ) -> None:
+        """A scoped reset must not touch the default context's cache."""
+        original = await _get_adapter(_CONFIG_TEST)
+
+        async def scoped() -> None:
+            reset_adapter_cache()
+            await _get_adapter(_CONFIG_TEST)
+
+        await asyncio.create_task(scoped())
+
+        assert _default_adapter_cache[_CONFIG_TEST._cache_key] is original
+        assert await _get_adapter(_CONFIG_TEST) is original
+
+    async def test_close_all_targets_context_cache(
+        self, make_adapter: Callable[..., Any]
+    ) -> None:
+        """close_all after a reset should only drain that context."""
+        default_adapter = make_adapter()
+        _cache()[("db", True, 100)] = default_adapter
+
+        async def scoped() -> None:
+            reset_adapter_cache()
+            scoped_adapter = make_adapter()
+            _cache()[("db", True, 100)] = scoped_adapter
+            await close_all()
+            scoped_adapter.close.assert_called_once()
+
+        await asyncio.create_task(scoped())
+
+        default_adapter.close.assert_not_called()
+        assert len(_default_adapter_cache) == 1
+
+
+class TestInvalidateAdapter:
+    """Tests for _invalidate_adapter."""
+
+    def test_evicts_only_matching_url(self) -> None:
+        """Should drop entries for the URL and keep the rest warm."""
+        kept = SimpleNamespace()
+        _cache()[("sqlite:///a.db", True, 100)] = SimpleNamespace()
+        _cache()[("sqlite:///a.db", False, 100)] = SimpleNamespace()
+        _cache()[("sqlite:///b.db", True, 100)] = kept
+
+        _invalidate_adapter("sqlite:///a.db")
+
+        assert list(_cache().values()) == [kept]
+
+    def test_unknown_url_is_noop(self) -> None:
+        """Should do nothing when the URL has no cached adapters."""
+        _cache()[("sqlite:///a.db", True, 100)] = SimpleNamespace()
+
+        _invalidate_adapter("sqlite:///missing.db")
+
+        assert len(_cache()) == 1
+
+
+class TestQueryCache:
+    """Tests for the read-only query result cache."""
+
+    def _cache_adapter(
+        self, read_only: bool
+    ) -> tuple[SQLToolConfig, SimpleNamespace]:
+        """Register a mock adapter in the cache for a config."""
+        config = SQLToolConfig(
             tool_name="soliplex_sql.tools.query",
-            database_url="sqlite:///db1.db",
-            read_only=True,
+            database_url="sqlite:///cache-test.db",
+            read_only=read_only,
             max_rows=100,
         )
-        config2 = SQLToolConfig(
-            tool_name="soliplex_sql.tools.query",
-            database_url="sqlite:///db2.db",
-            read_only=True,
-            max_rows=100,
+        adapter = SimpleNamespace(
+            read_only=read_only,
+            query=AsyncMock(
+                return_value={
+                    "columns": ["id"],
+                    "rows": [(1,)],
+                    "row_count": 1,
+                }
+            ),
         )
+        _cache()[config._cache_key] = adapter
+        return config, adapter
 
-        with patch.object(SQLToolConfig, "create_deps") as mock_create:
-            mock_deps = MagicMock()
-            mock_deps.database = MagicMock()
-            mock_deps.read_only = True
-            mock_deps.max_rows = 100
-            mock_create.return_value = mock_deps
+    async def test_repeated_select_hits_cache(self) -> None:
+        """Identical read-only queries should hit the DB only once."""
+        config, adapter = self._cache_adapter(read_only=True)
 
-            await _get_adapter(config1)
-            await _get_adapter(config2)
+        result1 = await query(config, "SELECT * FROM users")
+        result2 = await query(config, "SELECT * FROM users")
 
-            # Different database URLs = different adapters
-            assert mock_create.call_count == 2
+        assert result1 is result2
+        assert adapter.query.call_count == 1
 
+    async def test_different_queries_not_shared(self) -> None:
+        """Different SQL should not share cache entries."""
+        config, adapter = self._cache_adapter(read_only=True)
 
-class TestCloseAll:
-    """Tests for close_all."""
+        await query(config, "SELECT * FROM users")
+        await query(config, "SELECT * FROM posts")
+
+        assert adapter.query.call_count == 2
+
+    async def test_invalidate_adapter_purges_cached_results(self) -> None:
+        """A replacement adapter must not serve the old one's results."""
+        config, _ = self._cache_adapter(read_only=True)
+        await query(config, "SELECT * FROM users")
+
+        _invalidate_adapter(config.database_url)
+        _, replacement = self._cache_adapter(read_only=True)
+
+        await query(config, "SELECT * FROM users")
+
+        assert replacement.query.call_count == 1
+
+    async def test_expired_entry_dropped_and_refetched(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A stale entry should be evicted and the query re-run."""
+        monkeypatch.setattr("soliplex_sql.tools._QUERY_CACHE_TTL", 0.0)
+        config, adapter = self._cache_adapter(read_only=True)
+
+        await query(config, "SELECT * FROM users")
+        await query(config, "SELECT * FROM users")
+
+        assert adapter.query.call_count == 2
+        # The re-run stored a fresh entry; the stale one is gone.
+        assert len(_query_cache) == 1
+
+    async def test_store_sweeps_expired_entries_when_full(self) -> None:
+        """A full cache of stale entries should be swept on store."""
+        config, _ = self._cache_adapter(read_only=True)
+        for i in range(_QUERY_CACHE_MAX):
+            _query_cache[("stale", i)] = (0.0, {})
+
+        await query(config, "SELECT * FROM users")
+
+        assert len(_query_cache) == 1
+        assert ("stale", 0) not in _query_cache
 
-    def setup_method(self) -> None:
-        """Clear adapter cache before each test."""
-        _adapter_cache.clear()
+    async def test_store_evicts_oldest_live_entry_when_full(self) -> None:
+        """With only live entries, the oldest should make room."""
+        config, _ = self._cache_adapter(read_only=True)
+        far_future = time.monotonic() + 1000.0
+        for i in range(_QUERY_CACHE_MAX):
+            _query_cache[("live", i)] = (far_future, {})
 
-    def teardown_method(self) -> None:
-        """Clear adapter cache after each test."""
-        _adapter_cache.clear()
+        await query(config, "SELECT * FROM users")
 
-    async def test_closes_all_cached_adapters(self) -> None:
+        assert len(_query_cache) == _QUERY_CACHE_MAX
+        assert ("live", 0) not in _query_cache
+        assert ("live", 1) in _query_cache
+
+    async def test_writable_adapter_bypasses_cache(self) -> None:
+        """Writable adapters should never cache results."""
+        config, adapter = self._cache_adapter(read_only=False)
+
+        await query(config, "SELECT * FROM users")
+        await query(config, "SELECT * FROM users")
+
+        assert adapter.query.call_count == 2
+        assert len(_query_cache) == 0
+
+
+class TestSerializeResult:
+    """Tests for serialize_result."""
+
+    def test_round_trips_query_result(self) -> None:
+        """Serialized result should decode back to the same data."""
+        import json
+
+        result = {
+            "columns": ["id", "name"],
+            "rows": [(1, "Alice"), (2, "Bob")],
+            "row_count": 2,
+            "truncated": False,
+            "execution_time_ms": 5.0,
+        }
+
+        decoded = json.loads(serialize_result(result))
+
+        assert decoded["columns"] == ["id", "name"]
+        assert decoded["rows"] == [[1, "Alice"], [2, "Bob"]]
+        assert decoded["row_count"] == 2
+
+    def test_stdlib_fallback_without_orjson(self) -> None:
+        """Should fall back to stdlib json when orjson is missing."""
+        import json
+
+        with patch("soliplex_sql.tools.orjson", None):
+            output = serialize_result({"columns": [], "rows": []})
+
+        assert json.loads(output) == {"columns": [], "rows": []}
+
+
+class TestCloseAll:
+    """Tests for close_all."""
+
+    async def test_closes_all_cached_adapters(
+        self, make_adapter: Callable[..., Any]
+    ) -> None:
         """Should close all adapters in cache."""
-        mock_adapter1 = MagicMock()
-        mock_adapter1.close = AsyncMock()
-        mock_adapter2 = MagicMock()
-        mock_adapter2.close = AsyncMock()
+        mock_adapter1, mock_adapter2 = make_adapter(2)
 
-        _adapter_cache[("db1", True, 100)] = mock_adapter1
-        _adapter_cache[("db2", True, 100)] = mock_adapter2
+        _cache()[("db1", True, 100)] = mock_adapter1
+        _cache()[("db2", True, 100)] = mock_adapter2
 
         await close_all()
 
         mock_adapter1.close.assert_called_once()
         mock_adapter2.close.assert_called_once()
 
-    async def test_clears_cache(self) -> None:
+    async def test_clears_cache(
+        self, make_adapter: Callable[..., Any]
+    ) -> None:
         """Should clear the cache after closing."""
-        mock_adapter = MagicMock()
-        mock_adapter.close = AsyncMock()
-        _adapter_cache[("db", True, 100)] = mock_adapter
+        _cache()[("db", True, 100)] = make_adapter()
 
         await close_all()
 
-        assert len(_adapter_cache) == 0
+        assert len(_cache()) == 0
 
     async def test_handles_empty_cache(self) -> None:
         """Should handle empty cache gracefully."""
         await close_all()  # Should not raise
-        assert len(_adapter_cache) == 0
+        assert len(_cache()) == 0
+
+    async def test_closes_adapters_concurrently(self) -> None:
+        """Teardowns should overlap instead of running serially."""
+        async def slow_close() -> None:
+            await asyncio.sleep(0.05)
+
+        for i in range(10):
+            adapter = SimpleNamespace(close=AsyncMock(side_effect=slow_close))
+            _cache()[(f"db{i}", True, 100)] = adapter
+
+        start = time.perf_counter()
+        await close_all()
+        elapsed = time.perf_counter() - start
+
+        # Ten serial 0.05s closes would take 0.5s; concurrent ones
+        # finish in roughly one sleep (generous bound for slow CI).
+        assert elapsed < 0.3
+
+    async def test_close_failure_does_not_skip_others(
+        self, make_adapter: Callable[..., Any]
+    ) -> None:
+        """One failing close should not prevent the rest."""
+        failing = make_adapter()
+        failing.close.side_effect = RuntimeError("boom")
+        surviving = make_adapter()
+        _cache()[("db1", True, 100)] = failing
+        _cache()[("db2", True, 100)] = surviving
+
+        await close_all()  # Should not raise
+
+        surviving.close.assert_called_once()
+        assert len(_cache()) == 0